@@ -5,10 +5,12 @@ Licensed under CC BY-NC-SA 4.0
 import customtkinter as ctk
 from tkinter import ttk, messagebox
 import tkinter as tk
-from datetime import datetime, timedelta
+from datetime import datetime
 import json
 import os
+import re
 import sys
+import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from matplotlib.figure import Figure
@@ -17,12 +19,75 @@ import threading
 import queue
 import time
 from enum import Enum
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from functools import lru_cache
 
+try:
+    import orjson  # 可选依赖：更快的 JSON 序列化
+except ImportError:
+    orjson = None
+
+try:
+    from numba import njit  # 可选依赖：大数据量排序 JIT 编译
+except ImportError:
+    njit = None
+
 # 设置中文字体
 plt.rcParams['font.sans-serif'] = ['SimHei', 'Microsoft YaHei', 'DejaVu Sans']
 plt.rcParams['axes.unicode_minus'] = False
 
+# 状态编码，编码值与列表排序权重一致
+_STATUS_NAMES = ("due_today", "overdue", "due_soon", "pending", "completed")
+_DUE_TODAY, _OVERDUE, _DUE_SOON, _PENDING, _COMPLETED = range(5)
+_SORT_WEIGHTS = {name: code for code, name in enumerate(_STATUS_NAMES)}
+
+# 饼图分类：(状态, 标签, 颜色)，按绘制顺序排列
+_PIE_CATEGORIES = (
+    ('completed', '已完成', '#28a745'),
+    ('overdue', '逾期', '#dc3545'),
+    ('due_today', '今天截止', '#fd7e14'),
+    ('due_soon', '即将截止', '#ffc107'),
+    ('pending', '进行中', '#007bff'),
+)
+
+# 列表状态列：状态 -> (显示文字, 行标签)，各行共用同一组字符串和元组
+_STATUS_DISPLAY = {
+    'completed': ("✅ 已完成", ("completed",)),
+    'due_today': ("🔥 今天截止", ("due_today",)),
+    'overdue': ("⚠️ 逾期", ("overdue",)),
+    'due_soon': ("⏰ 即将截止", ("due_soon",)),
+    'pending': ("📝 进行中", ("",)),
+}
+
+# 右键菜单字体
+_CONTEXT_MENU_FONT = ('Microsoft YaHei', 20)
+
+# 作业数超过该值时才使用 JIT 排序，数据量小时编译开销不划算
+_JIT_SORT_MIN = 500
+
+def _sort_permutation(weights, due_days):
+    """按状态权重、截止日期序数稳定排序，返回下标排列"""
+    # 序数天远小于 2**40，合并为单个键后一次稳定排序即可
+    keys = weights.astype(np.int64) * (1 << 40) + due_days
+    return np.argsort(keys, kind='mergesort')
+
+_sort_permutation_jit = njit(cache=True)(_sort_permutation) if njit is not None else None
+
+# 日志超过该大小时写一次完整快照并清空日志
+_JOURNAL_MAX_BYTES = 1 << 20
+
+# 只有这些设置需要重启才能生效（颜色主题只对之后创建的控件起作用），其余设置即时应用
+_RESTART_KEYS = frozenset({"color_theme"})
+
+@lru_cache(maxsize=64)
+def _font(size, weight="normal", family=None):
+    """按 (字号, 粗细, 字体) 复用 CTkFont 对象（需在创建根窗口之后调用）"""
+    return ctk.CTkFont(size=size, weight=weight, family=family)
+
+# 日期格式：D/M/YYYY、D/M/YY，分隔符可为 / 或 -
+_DATE_RE = re.compile(r'^\s*(\d{1,2})[/-](\d{1,2})[/-](\d{2}|\d{4})\s*$')
+
 class TaskType(Enum):
     LOAD_DATA = "load_data"
     SAVE_DATA = "save_data" 
@@ -33,6 +98,15 @@ class TaskType(Enum):
     DELETE_HOMEWORK = "delete_homework"
     CLEAR_ALL = "clear_all"
     MARK_COMPLETED = "mark_completed"
+    REFRESH_STATUSES = "refresh_statuses"
+
+# 无参数、重复执行结果相同的任务：队列中已有同类任务等待执行时不再重复提交
+_COALESCED_TASKS = frozenset({
+    TaskType.SAVE_DATA,
+    TaskType.REFRESH_LIST,
+    TaskType.UPDATE_CHARTS,
+    TaskType.REFRESH_STATUSES,
+})
 
 class HomeworkPlatform:
     def __init__(self, root, vers="2.9"):
@@ -43,6 +117,8 @@ class HomeworkPlatform:
         self.root.title(f"学生自托管作业登记平台 v{self.vers}")
         # 数据文件
         self.data_file = "homework_data.json"
+        # 增量修改日志：两次完整保存之间的增删改逐条追加到这里
+        self.journal_file = self.data_file + ".log"
         
         # 默认设置
         self.settings = {
@@ -58,22 +134,61 @@ class HomeworkPlatform:
             "chart_days": 5
         }
         
-        # 线程安全的数据结构
+        # 图表汇总数据；每次作废时版本号加一，后台算出的汇总数据只在期间未作废时采用
+        # （需在第一次给 homeworks 赋值之前创建，其 setter 会作废图表数据）
+        self._chart_data = None
+        self._chart_data_version = 0
+        
+        # 线程安全的数据结构（作业按代号存放在有序字典中，homeworks 为其视图）
         self.homeworks = []
         self.data_loaded = False
         
         # 统一任务队列系统
-        self.task_queue = queue.Queue()
+        self.task_queue = queue.SimpleQueue()
+        self._queued_count = 0
         self.current_task = None
         self.task_in_progress = False
+        self._queued_types = set()
+        self._task_handlers = {
+            TaskType.LOAD_DATA: self.execute_load_data_optimized,
+            TaskType.SAVE_DATA: self.execute_save_data,
+            TaskType.ADD_HOMEWORK: self.execute_add_homework,
+            TaskType.REFRESH_LIST: self.execute_refresh_list_optimized,
+            TaskType.UPDATE_CHARTS: self.execute_update_charts,
+            TaskType.QUERY_HOMEWORK: self.execute_query_homework,
+            TaskType.DELETE_HOMEWORK: self.execute_delete_homework,
+            TaskType.CLEAR_ALL: self.execute_clear_all,
+            TaskType.MARK_COMPLETED: self.execute_mark_completed,
+            TaskType.REFRESH_STATUSES: self.execute_refresh_statuses,
+        }
         
         # 优化：添加缓存和状态管理
         self._status_cache = {}
+        self._reset_status_table()
+        self._code_to_item_id = {}
         self._last_status_update = None
         self._processing_threads = []
+        # 列表刷新的后台计算复用同一工作线程；刷新任务本身由队列串行执行
+        self._refresh_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="hw-refresh")
+        
+        # 后台保存：界面线程取快照 + 合并写入线程
+        self._pending_snapshot = None
+        # 待写快照已包含、但尚未写入日志文件的修改；写快照前先补写进日志
+        self._snapshot_journal = []
+        self._pending_journal = []
+        # 自上次取快照以来是否有修改；没有修改时关闭窗口不重写数据文件
+        self._dirty = False
+        # 启动时数据文件读取失败：之后写快照前先把原文件改名保留，绝不直接覆盖
+        self._load_failed = False
+        self._save_event = threading.Event()
+        self._save_lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        threading.Thread(target=self._save_loop, daemon=True).start()
         
         # 先加载数据，再创建界面
         self.load_data_synchronously()
+        self.precompute_homework_statuses()
+        self._last_refresh_day = self._today_date
         
         # 应用主题设置
         ctk.set_appearance_mode(self.settings["theme_mode"])
@@ -85,18 +200,20 @@ class HomeworkPlatform:
         # 创建界面
         self.create_widgets()
         
-        # 启动任务处理器
-        self.process_tasks()
+        # 任务由 submit_task / task_completed 事件驱动执行，无需轮询
+        self.submit_task(TaskType.REFRESH_LIST)
         
         # 启动状态刷新定时器
         self.start_status_refresh_timer()
+        
+        # 关闭窗口前写出未保存的数据
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
     
     def load_data_synchronously(self):
         """同步加载数据，确保在创建界面之前完成"""
         try:
             if os.path.exists(self.data_file):
-                with open(self.data_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
+                data = self._read_data_file()
                 
                 if isinstance(data, dict) and "homeworks" in data and "settings" in data:
                     self.homeworks = data["homeworks"]
@@ -112,71 +229,169 @@ class HomeworkPlatform:
             else:
                 self.data_loaded = True
                 print("数据文件不存在，使用默认设置")
+            
+            # 重放上次完整保存之后记录的增量修改
+            if os.path.exists(self.journal_file):
+                self.homeworks = self._replay_journal(list(self.homeworks))
                 
         except Exception as e:
             print(f"加载数据时出错: {e}")
+            self._load_failed = True
             self.data_loaded = True
             # 出错时使用默认设置
 
+    @property
+    def homeworks(self):
+        """所有作业（按添加顺序），为 代号 -> 作业 字典的值视图"""
+        return self._hw_by_code.values()
+    
+    @homeworks.setter
+    def homeworks(self, homework_list):
+        """整体替换作业列表时重建 代号 -> 作业 索引及规范化日期"""
+        self._hw_by_code = {hw['code']: hw for hw in homework_list}
+        self._invalidate_chart_data()
+        self._due_norm = {}
+        self._create_norm = {}
+        for hw in self._hw_by_code.values():
+            self._index_dates(hw)
+    
+    def _index_dates(self, hw):
+        """记录作业规范化后的截止、创建日期，查询时直接比较字符串"""
+        code = hw['code']
+        self._due_norm[code] = self.normalize_date(hw['due_date'])
+        self._create_norm[code] = self.normalize_date(hw['create_date'])
+
+    def _read_data_file(self):
+        """读取并解析数据文件（优先使用 orjson）"""
+        with open(self.data_file, 'rb') as f:
+            raw = f.read()
+        if orjson is not None:
+            return orjson.loads(raw)
+        return json.loads(raw.decode('utf-8'))
+
     # ========== 优化方法：日期缓存 ==========
-    @lru_cache(maxsize=1000)
-    def parse_date_cached(self, date_str):
-        """带缓存的日期解析"""
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def parse_date_cached(date_str):
+        """带缓存的日期解析（结果只取决于字符串，缓存跨实例、跨清空保留；条目数受不同日期字符串数量限制，无需设上限）"""
         if not date_str:
             return None
-            
-        date_str = date_str.strip()
         
-        # 快速解析（假设格式固定为 DD/MM/YYYY）
-        try:
-            parts = date_str.split('/')
-            if len(parts) == 3:
-                day, month, year = int(parts[0]), int(parts[1]), int(parts[2])
-                if year < 100: 
-                    year += 2000
-                return datetime(year, month, day)
-        except (ValueError, IndexError):
-            pass
-        
-        # 回退到原始方法
-        formats = ["%d/%m/%Y", "%d/%m/%y", "%d-%m-%Y", "%d-%m-%y"]
-        for fmt in formats:
-            try:
-                return datetime.strptime(date_str, fmt)
-            except ValueError:
-                continue
+        match = _DATE_RE.match(date_str)
+        if not match:
+            return None
         
-        return None
+        day, month, year = map(int, match.groups())
+        if year < 100:
+            year += 2000
+        try:
+            return datetime(year, month, day)
+        except ValueError:
+            return None
 
     def precompute_homework_statuses(self):
-        """预处理所有作业状态"""
-        today = datetime.now().date()
+        """预处理所有作业状态及是否显示（NumPy 向量化）"""
+        # 每次批量刷新只取一次当前时间，单个作业的状态查询也沿用这一天
+        now = datetime.now()
+        self._today_date = now.date()
+        today_ord = self._today_date.toordinal()
         remind_days = self.settings["remind_days"]
+        due_ordinal = self._due_ordinal
         
-        self._status_cache.clear()
-        
+        # 单次遍历取出代号、截止日期序数天（无法解析的记为 -1）和完成标记
+        codes = []
+        due_list = []
+        completed_list = []
         for hw in self.homeworks:
-            due_date_str = hw['due_date']
-            due_date = self.parse_date_cached(due_date_str)
-            
-            if not due_date:
-                status = "pending"
-            elif hw.get('status') == 'completed':
-                status = "completed"
-            else:
-                due_date_only = due_date.date()
-                if due_date_only < today:
-                    status = "overdue"
-                elif due_date_only == today:
-                    status = "due_today"
-                elif (due_date_only - today).days <= remind_days:
-                    status = "due_soon"
-                else:
-                    status = "pending"
-            
-            self._status_cache[hw['code']] = status
+            codes.append(hw['code'])
+            due_list.append(due_ordinal(hw['due_date']))
+            completed_list.append(hw.get('status') == 'completed')
+        due_days = np.array(due_list, dtype=np.int64)
+        completed = np.array(completed_list, dtype=bool)
+        valid = due_days >= 0
+        delta = due_days - today_ord
+        
+        # 条件按优先级排列，np.select 取第一个满足的条件
+        status_codes = np.select(
+            [~valid, completed, delta < 0, delta == 0, delta <= remind_days],
+            [_PENDING, _COMPLETED, _OVERDUE, _DUE_TODAY, _DUE_SOON],
+            default=_PENDING)
+        # 已完成且已过截止日期的作业不显示
+        display = ~(completed & valid & (delta < 0))
         
-        self._last_status_update = datetime.now()
+        self._status_cache.clear()
+        self._status_cache.update(zip(codes, [_STATUS_NAMES[c] for c in status_codes.tolist()]))
+        
+        # 排序权重：已完成的作业（包括截止日期无效的）总是排在最后
+        weights = np.where(completed, _COMPLETED, status_codes).astype(np.int8)
+        self._status_table = ({code: i for i, code in enumerate(codes)}, weights, due_days, display)
+        self._invalidate_chart_data()
+        
+        self._last_status_update = now
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _due_ordinal(date_str):
+        """日期字符串转换为序数天，无法解析时返回 -1（按字符串缓存）"""
+        date_obj = HomeworkPlatform.parse_date_cached(date_str)
+        return date_obj.toordinal() if date_obj else -1
+
+    def _reset_status_table(self):
+        """清空排序用状态表：(代号 -> 位置, 排序权重, 截止日期序数, 是否显示)"""
+        self._status_table = ({}, np.empty(0, dtype=np.int8), np.empty(0, dtype=np.int64),
+                              np.empty(0, dtype=bool))
+
+    def _invalidate_chart_data(self):
+        """作业或状态变化后作废汇总的图表数据，下次使用时重新计算"""
+        self._chart_data = None
+        self._chart_data_version += 1
+
+    def _recompute_status_for(self, hw, today, remind_days):
+        """只更新单个作业的状态缓存和状态表中的一行（增删改时使用，避免全量重算）"""
+        code = hw['code']
+        completed = hw.get('status') == 'completed'
+        status = self._classify_homework(hw, today, remind_days)
+        due_day = self._due_ordinal(hw['due_date'])
+        # 与批量计算相同：已完成且已过截止日期的作业不显示
+        display = not (completed and 0 <= due_day < today.toordinal())
+        self._status_cache[code] = status
+        self._invalidate_chart_data()
+        
+        weight = _COMPLETED if completed else _SORT_WEIGHTS[status]
+        code_pos, weights, due_days, displays = self._status_table
+        pos = code_pos.get(code)
+        if pos is not None:
+            weights[pos] = weight
+            due_days[pos] = due_day
+            displays[pos] = display
+        else:
+            # 新作业：复制后追加并整体替换，正在读取旧表的工作线程不受影响
+            code_pos = dict(code_pos)
+            code_pos[code] = len(weights)
+            self._status_table = (
+                code_pos,
+                np.append(weights, np.int8(weight)),
+                np.append(due_days, np.int64(due_day)),
+                np.append(displays, display),
+            )
+
+    def _classify_homework(self, hw, today, remind_days):
+        """根据截止日期计算单个作业状态（today 为 date 对象）"""
+        due_date = self.parse_date_cached(hw['due_date'])
+        
+        if not due_date:
+            return "pending"
+        if hw.get('status') == 'completed':
+            return "completed"
+        
+        due_date_only = due_date.date()
+        if due_date_only < today:
+            return "overdue"
+        elif due_date_only == today:
+            return "due_today"
+        elif (due_date_only - today).days <= remind_days:
+            return "due_soon"
+        return "pending"
 
     def get_homework_status_optimized(self, homework_code):
         """优化版作业状态获取"""
@@ -184,26 +399,29 @@ class HomeworkPlatform:
             return self._status_cache[homework_code]
         
         # 如果缓存中没有，计算并缓存
-        for hw in self.homeworks:
-            if hw['code'] == homework_code:
-                status = self.get_homework_status(hw['due_date'])
-                self._status_cache[homework_code] = status
-                return status
+        hw = self._hw_by_code.get(homework_code)
+        if hw:
+            status = self.get_homework_status(hw['due_date'])
+            self._status_cache[homework_code] = status
+            return status
         
         return "pending"
 
     def start_status_refresh_timer(self):
-        """启动状态刷新定时器"""
+        """启动状态刷新定时器 - 只有日期变化时才重新计算状态"""
         def refresh_states():
-            if self.data_loaded and self.homeworks:
-                # 检查是否需要刷新（每小时刷新一次）
-                if (self._last_status_update is None or 
-                    (datetime.now() - self._last_status_update).seconds > 3600):
-                    self.precompute_homework_statuses()
-                    self.submit_task(TaskType.REFRESH_LIST)
+            today = datetime.now().date()
+            if self.data_loaded and self.homeworks and today != self._last_refresh_day:
+                self.precompute_homework_statuses()
+                self._last_refresh_day = today
+                self.submit_task(TaskType.REFRESH_STATUSES)
+                self.submit_task(TaskType.UPDATE_CHARTS)
+            elif today != self._today_date:
+                # 没有需要重算的作业，只把当天日期推进到今天
+                self._today_date = today
             
-            # 每小时检查一次
-            self.root.after(3600 * 1000, refresh_states)
+            # 每5分钟检查一次，跨过零点后最多延迟5分钟刷新
+            self.root.after(5 * 60 * 1000, refresh_states)
         
         refresh_states()
 
@@ -234,9 +452,8 @@ class HomeworkPlatform:
                 output_queue.put({"type": "error", "message": "文件不存在"})
                 output_queue.put({"type": "end"})
                 return
-                
-            with open(self.data_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            
+            data = self._read_data_file()
             if isinstance(data, dict) and "homeworks" in data and "settings" in data:
                 settings_updated = True
                 homework_data = data["homeworks"]
@@ -289,15 +506,22 @@ class HomeworkPlatform:
                 elif item["type"] == "complete":
                     output_queue.put(item)
                 elif item["type"] == "data_batch":
+                    today = datetime.now().date()
+                    remind_days = self.settings["remind_days"]
                     processed_batch = []
+                    display_items = []
                     for hw in item["data"]:
                         if 'status' not in hw:
                             hw['status'] = 'pending'
                         processed_batch.append(hw)
+                        # 在工作线程中完成格式化，界面线程只负责插入
+                        status = self._classify_homework(hw, today, remind_days)
+                        display_items.append(self._prepare_display_item_static(hw, status))
                     
                     output_queue.put({
                         "type": "processed_batch",
                         "data": processed_batch,
+                        "display_items": display_items,
                         "batch_info": item["batch_info"],
                         "total_count": item.get("total_count", 0)
                     })
@@ -325,6 +549,7 @@ class HomeworkPlatform:
                     self.root.after(0, lambda: self.on_load_data_error(item["message"]))
                     break
                 elif item["type"] == "complete":
+                    all_homeworks = self._replay_journal(all_homeworks)
                     self.homeworks = all_homeworks
                     self.data_loaded = True
                     
@@ -341,7 +566,7 @@ class HomeworkPlatform:
                     current_batch += 1
                     
                     if current_batch <= 3:
-                        self.root.after(0, lambda data=item["data"]: self._display_immediate_batch(data))
+                        self.root.after(0, lambda items=item["display_items"]: self._display_immediate_batch(items))
                     
                     total_count = item.get('total_count', len(all_homeworks))
                     self.root.after(0, lambda: self._update_loading_progress(
@@ -359,61 +584,49 @@ class HomeworkPlatform:
         ctk.set_default_color_theme(self.settings["color_theme"])
         self.apply_window_size()
 
-    def _display_immediate_batch(self, batch_data):
-        """立即显示批次数据"""
+    def _display_immediate_batch(self, display_items):
+        """立即显示批次数据（display_items 已在工作线程中格式化）"""
         if not hasattr(self, '_immediate_displayed'):
-            for item in self.tree.get_children():
-                self.tree.delete(item)
+            self._clear_tree()
             self._immediate_displayed = True
         
-        for hw in batch_data:
-            self.insert_homework_item(hw)
+        self._insert_display_rows(display_items)
 
     def _update_loading_progress(self, message):
         """更新加载进度"""
-        if hasattr(self, 'temp_message_label'):
-            self.temp_message_label.configure(text=message)
+        self.temp_message_label.configure(text=message)
 
     def show_loading_message(self, message):
         """显示加载消息"""
-        if hasattr(self, 'temp_message_label'):
-            self.temp_message_label.destroy()
-        
-        self.temp_message_label = ctk.CTkLabel(self.root, text=message, 
-                                              font=ctk.CTkFont(size=14),
-                                              fg_color="#d1ecf1", text_color="#0c5460",
-                                              corner_radius=5)
-        self.temp_message_label.place(relx=0.5, rely=0.1, anchor="center")
+        self._show_message_label(message, fg_color="#d1ecf1", text_color="#0c5460")
 
     # ========== 优化方法：Treeview批量插入 ==========
-    def batch_update_treeview_optimized(self, sorted_homeworks):
-        """优化版树形视图更新 - 批量插入"""
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+    def _format_rows(self, sorted_homeworks):
+        """格式化为 (values, tags) 行数据，可在工作线程中调用"""
+        status_cache = self._status_cache
+        prepare = self._prepare_display_item_static
+        return [prepare(hw, status_cache.get(hw['code'], "pending")) for hw in sorted_homeworks]
+
+    def batch_update_treeview_optimized(self, display_data):
+        """优化版树形视图更新 - 批量插入已格式化的行"""
+        self._clear_tree()
         
-        total_count = len(sorted_homeworks)
+        total_count = len(display_data)
         
         if total_count > 200:
-            self.incremental_batch_insert(sorted_homeworks, batch_size=100)
+            self.incremental_batch_insert(display_data, batch_size=100)
         else:
-            self.direct_batch_insert(sorted_homeworks)
+            self.direct_batch_insert(display_data)
     
-    def direct_batch_insert(self, homeworks):
+    def direct_batch_insert(self, display_data):
         """直接批量插入"""
-        display_data = []
+        self._insert_display_rows(display_data)
         
-        for hw in homeworks:
-            status = self._status_cache.get(hw['code'], "pending")
-            display_data.append(self.prepare_display_item(hw, status))
-        
-        for values, tags in display_data:
-            item = self.tree.insert("", "end", values=values, tags=tags)
-        
-        self.finalize_treeview_update(len(homeworks))
+        self.finalize_treeview_update(len(display_data))
 
-    def incremental_batch_insert(self, homeworks, batch_size=100):
+    def incremental_batch_insert(self, display_data, batch_size=100):
         """增量批量插入"""
-        total_count = len(homeworks)
+        total_count = len(display_data)
         
         self.progress_frame = ctk.CTkFrame(self.result_frame)
         self.progress_frame.pack(fill="x", padx=10, pady=5)
@@ -427,22 +640,14 @@ class HomeworkPlatform:
         self.progress_bar.set(0)
         
         self._current_batch_index = 0
-        self._process_next_batch(homeworks, batch_size, total_count)
+        self._process_next_batch(display_data, batch_size, total_count)
 
-    def _process_next_batch(self, homeworks, batch_size, total_count):
+    def _process_next_batch(self, display_data, batch_size, total_count):
         """处理下一批数据"""
         start_idx = self._current_batch_index
         end_idx = min(start_idx + batch_size, total_count)
         
-        batch_data = homeworks[start_idx:end_idx]
-        display_data = []
-        
-        for hw in batch_data:
-            status = self._status_cache.get(hw['code'], "pending")
-            display_data.append(self.prepare_display_item(hw, status))
-        
-        for values, tags in display_data:
-            self.tree.insert("", "end", values=values, tags=tags)
+        self._insert_display_rows(display_data[start_idx:end_idx])
         
         progress = end_idx / total_count
         self.progress_bar.set(progress)
@@ -450,29 +655,62 @@ class HomeworkPlatform:
         
         if end_idx < total_count:
             self._current_batch_index = end_idx
-            self.root.after(10, self._process_next_batch, homeworks, batch_size, total_count)
+            self.root.after(10, self._process_next_batch, display_data, batch_size, total_count)
         else:
             self.progress_frame.destroy()
             self.finalize_treeview_update(total_count)
 
+    def _insert_display_rows(self, display_data):
+        """批量插入行 - 拼接为一段 Tcl 脚本一次执行，插入期间暂时隐藏所有列"""
+        try:
+            script = self._build_insert_script(display_data)
+        except Exception:
+            script = None
+        
+        self.tree.configure(displaycolumns=())
+        try:
+            if script is not None:
+                self.tree.tk.eval(script)
+            else:
+                insert = self.tree.insert
+                for values, tags in display_data:
+                    insert("", "end", values=values, tags=tags)
+        finally:
+            self.tree.configure(displaycolumns="#all")
+        
+        # 记录 代号 -> 行ID，供日期变化时原地更新
+        if display_data:
+            children = self.tree.get_children()
+            new_ids = children[len(children) - len(display_data):]
+            for (values, _), item_id in zip(display_data, new_ids):
+                self._code_to_item_id[values[0]] = item_id
+
+    def _clear_tree(self):
+        """清空表格及行ID映射（一次 Tcl 调用删除全部行）"""
+        children = self.tree.get_children()
+        if children:
+            self.tree.delete(*children)
+        self._code_to_item_id.clear()
+
+    def _build_insert_script(self, display_data):
+        """生成批量插入的 Tcl 脚本，值由 tkinter 按 Tcl 列表规则转义"""
+        widget = self.tree._w
+        stringify = tk._stringify
+        return "\n".join(
+            f"{widget} insert {{}} end -values {stringify(values)} -tags {stringify(tags)}"
+            for values, tags in display_data
+        )
+
     def prepare_display_item(self, hw, status):
         """准备显示项数据"""
+        return self._prepare_display_item_static(hw, status)
+
+    @staticmethod
+    def _prepare_display_item_static(hw, status):
+        """准备显示项数据（不访问界面，可在工作线程中调用）"""
         if hw.get('status') == 'completed':
-            display_status = "✅ 已完成"
-            tags = ("completed",)
-        else:
-            if status == "due_today":
-                display_status = "🔥 今天截止"
-                tags = ("due_today",)
-            elif status == "overdue":
-                display_status = "⚠️ 逾期"
-                tags = ("overdue",)
-            elif status == "due_soon":
-                display_status = "⏰ 即将截止"
-                tags = ("due_soon",)
-            else:
-                display_status = "📝 进行中"
-                tags = ("",)
+            status = 'completed'
+        display_status, tags = _STATUS_DISPLAY.get(status, _STATUS_DISPLAY['pending'])
         
         values = (hw["code"], hw["subject"], hw["content"], 
                  hw["create_date"], hw["due_date"], display_status)
@@ -481,11 +719,6 @@ class HomeworkPlatform:
 
     def finalize_treeview_update(self, total_count):
         """完成树形视图更新"""
-        self.tree.tag_configure("completed", background="#e9ecef", foreground="#6c757d")
-        self.tree.tag_configure("overdue", background="#f8d7da", foreground="#721c24")
-        self.tree.tag_configure("due_today", background="#dc3545", foreground="white")
-        self.tree.tag_configure("due_soon", background="#fff3cd", foreground="#856404")
-        
         self.result_title.configure(text=f"所有作业 (共{total_count}项) - 今天截止的作业已标红")
         self.update_stats()
         self.task_completed()
@@ -493,95 +726,146 @@ class HomeworkPlatform:
     # ========== 任务队列系统 ==========
     def submit_task(self, task_type, **kwargs):
         """提交任务到队列"""
+        if task_type in _COALESCED_TASKS and not kwargs:
+            if task_type in self._queued_types:
+                return
+            self._queued_types.add(task_type)
+        
         task = {
             "type": task_type,
             "kwargs": kwargs,
             "submit_time": time.time()
         }
         self.task_queue.put(task)
+        self._queued_count += 1
         self.update_queue_status()
+        self.root.after_idle(self._drain_tasks)
     
-    def process_tasks(self):
-        """处理任务队列的主循环"""
-        try:
-            if not self.task_in_progress and not self.task_queue.empty():
+    def _drain_tasks(self):
+        """执行队列中的任务，直到队列为空或有异步任务尚未完成"""
+        while not self.task_in_progress:
+            try:
                 task = self.task_queue.get_nowait()
-                self.execute_task(task)
-        except queue.Empty:
-            pass
-        finally:
-            self.root.after(50, self.process_tasks)
+            except queue.Empty:
+                return
+            self._queued_count -= 1
+            self.execute_task(task)
     
     def execute_task(self, task):
         """执行单个任务"""
+        # 开始执行后再提交的同类任务需要重新排队，以反映执行期间的变化
+        self._queued_types.discard(task["type"])
         self.task_in_progress = True
         self.current_task = task
         self.update_queue_status()
         
-        task_type = task["type"]
-        kwargs = task["kwargs"]
-        
-        if task_type == TaskType.LOAD_DATA:
-            self.execute_load_data_optimized()
-        elif task_type == TaskType.SAVE_DATA:
-            self.execute_save_data()
-        elif task_type == TaskType.ADD_HOMEWORK:
-            self.execute_add_homework(**kwargs)
-        elif task_type == TaskType.REFRESH_LIST:
-            self.execute_refresh_list_optimized()
-        elif task_type == TaskType.UPDATE_CHARTS:
-            self.execute_update_charts()
-        elif task_type == TaskType.QUERY_HOMEWORK:
-            self.execute_query_homework(**kwargs)
-        elif task_type == TaskType.DELETE_HOMEWORK:
-            self.execute_delete_homework(**kwargs)
-        elif task_type == TaskType.CLEAR_ALL:
-            self.execute_clear_all()
-        elif task_type == TaskType.MARK_COMPLETED:
-            self.execute_mark_completed(**kwargs)
+        handler = self._task_handlers.get(task["type"])
+        if handler is None:
+            # 未知任务类型，直接结束以免阻塞队列
+            self.task_completed()
+            return
+        handler(**task["kwargs"])
     
     def execute_refresh_list_optimized(self):
         """优化版刷新列表"""
+        # 在界面线程取列表副本，后台排序期间增删作业不影响遍历
+        homeworks = list(self.homeworks)
+        chart_version = self._chart_data_version
+        
         def process_data():
-            display_homeworks = [hw for hw in self.homeworks if self.should_display_homework(hw)]
-            sorted_homeworks = self.optimized_sort_homeworks(display_homeworks)
-            self.root.after(0, lambda: self.batch_update_treeview_optimized(sorted_homeworks))
+            try:
+                sorted_homeworks = self.filter_and_sort(homeworks)
+                # 行格式化也在工作线程完成，界面线程只负责插入
+                display_data = self._format_rows(sorted_homeworks)
+                # 顺便汇总图表数据，随后的 UPDATE_CHARTS 直接使用
+                chart_data = self._compute_chart_data(homeworks)
+            except Exception as e:
+                print(f"刷新列表时出错: {e}")
+                # 出错也要结束当前任务，否则任务队列会一直等待
+                self.root.after(0, self.task_completed)
+                return
+            self.root.after(0, lambda: self._on_refresh_list_ready(display_data, chart_data, chart_version))
         
-        threading.Thread(target=process_data, daemon=True).start()
+        self._refresh_pool.submit(process_data)
+
+    def _on_refresh_list_ready(self, display_data, chart_data, chart_version):
+        """在界面线程中采用后台结果；取快照之后图表数据已作废时丢弃这份汇总"""
+        if self._chart_data_version == chart_version:
+            self._chart_data = chart_data
+        self.batch_update_treeview_optimized(display_data)
+
+    def execute_refresh_statuses(self):
+        """日期变化后原地更新表格中的状态和顺序，不重建整个列表"""
+        sorted_homeworks = self.filter_and_sort(self.homeworks)
+        item_ids = self._code_to_item_id
+        
+        # 表格中缺少应显示的作业（例如当前为查询结果）时，退回完整刷新
+        if any(hw['code'] not in item_ids for hw in sorted_homeworks):
+            self.task_completed()
+            self.submit_task(TaskType.REFRESH_LIST)
+            return
+        
+        # 过期的已完成作业不再显示
+        visible_codes = {hw['code'] for hw in sorted_homeworks}
+        hidden_ids = [item_ids.pop(code) for code in list(item_ids) if code not in visible_codes]
+        if hidden_ids:
+            self.tree.delete(*hidden_ids)
+        
+        ordered_ids = []
+        for hw in sorted_homeworks:
+            item_id = item_ids[hw['code']]
+            values, tags = self.prepare_display_item(hw, self._status_cache.get(hw['code'], "pending"))
+            self.tree.item(item_id, values=values, tags=tags)
+            ordered_ids.append(item_id)
+        
+        # 状态变化可能改变排序，仅在顺序不同时移动行
+        if list(self.tree.get_children()) != ordered_ids:
+            for index, item_id in enumerate(ordered_ids):
+                self.tree.move(item_id, "", index)
+        
+        self.finalize_treeview_update(len(sorted_homeworks))
 
     def optimized_sort_homeworks(self, homeworks):
-        """优化版作业排序"""
-        sort_keys = []
-        for hw in homeworks:
-            status = self._status_cache.get(hw['code'], "pending")
-            due_date = self.parse_date_cached(hw['due_date'])
-            
-            if hw.get('status') == 'completed':
-                weight = 4
-            elif status == "due_today":
-                weight = 0
-            elif status == "overdue":
-                weight = 1
-            elif status == "due_soon":
-                weight = 2
-            else:
-                weight = 3
-            
-            sort_keys.append((weight, due_date or datetime.min))
+        """优化版作业排序（不过滤）"""
+        return self.filter_and_sort(homeworks, display_only=False)
+
+    def filter_and_sort(self, homeworks, display_only=True):
+        """从状态表按位置批量取出显示标记和排序键，再按状态权重、截止日期做 NumPy 稳定排序"""
+        code_pos, weight_arr, due_arr, display_arr = self._status_table
+        homeworks = list(homeworks)
+        positions = np.fromiter((code_pos[hw['code']] for hw in homeworks),
+                                dtype=np.intp, count=len(homeworks))
+        
+        if display_only:
+            keep = np.flatnonzero(display_arr[positions])
+            positions = positions[keep]
+            visible = [homeworks[i] for i in keep.tolist()]
+        else:
+            visible = homeworks
         
-        sorted_pairs = sorted(zip(homeworks, sort_keys), key=lambda x: x[1])
-        return [hw for hw, _ in sorted_pairs]
+        if len(visible) < 2:
+            return visible
+        
+        # 无法解析的截止日期序数为 -1，排在同一权重的最前面
+        weights = weight_arr[positions]
+        due_days = due_arr[positions]
+        if _sort_permutation_jit is not None and len(visible) > _JIT_SORT_MIN:
+            order = _sort_permutation_jit(weights, due_days)
+        else:
+            order = np.lexsort((due_days, weights))
+        return [visible[i] for i in order.tolist()]
 
     def task_completed(self):
         """任务完成回调"""
         self.task_in_progress = False
         self.current_task = None
         self.update_queue_status()
+        self.root.after_idle(self._drain_tasks)
 
     def update_queue_status(self):
         """更新队列状态显示"""
         if hasattr(self, 'queue_status_label'):
-            queue_size = self.task_queue.qsize()
+            queue_size = self._queued_count
             current_task = self.current_task["type"].value if self.current_task else "无"
             status_text = f"队列: {queue_size} | 当前: {current_task}"
             self.queue_status_label.configure(text=status_text)
@@ -592,8 +876,7 @@ class HomeworkPlatform:
         self.homeworks = homework_data
         self.data_loaded = True
         
-        if hasattr(self, 'temp_message_label'):
-            self.temp_message_label.destroy()
+        self.hide_temp_message()
         
         self.update_stats()
         self.submit_task(TaskType.REFRESH_LIST)
@@ -609,40 +892,182 @@ class HomeworkPlatform:
         self.homeworks = []
         self.data_loaded = True
         
-        if hasattr(self, 'temp_message_label'):
-            self.temp_message_label.destroy()
+        self.hide_temp_message()
             
         messagebox.showerror("加载错误", f"加载数据时出错：{error_msg}")
         self.task_completed()
 
     # ========== 其他任务执行方法 ==========
     def execute_save_data(self):
-        """执行保存数据任务"""
-        def save_task():
+        """执行保存数据任务 - 在界面线程中取快照，由后台线程编码并合并写入"""
+        self._take_snapshot()
+        self._save_event.set()
+        self.task_completed()
+    
+    def _journal(self, op, **record):
+        """记录一条增量修改（add/delete/mark/clear），由后台线程合并追加到日志文件"""
+        record["op"] = op
+        with self._save_lock:
+            self._pending_journal.append(record)
+            self._dirty = True
+        self._save_event.set()
+    
+    def _take_snapshot(self):
+        """复制当前作业列表和设置，避免后台编码时数据被修改"""
+        snapshot = {
+            "homeworks": list(self.homeworks),
+            "settings": dict(self.settings)
+        }
+        with self._save_lock:
+            self._pending_snapshot = snapshot
+            # 快照已包含此前记录的所有修改，转为随快照一起写出
+            self._snapshot_journal.extend(self._pending_journal)
+            self._pending_journal = []
+            self._dirty = False
+    
+    def _save_loop(self):
+        """后台保存线程：合并约500ms内的多次保存请求为一次写入"""
+        while True:
+            self._save_event.wait()
+            time.sleep(0.5)
+            self._save_event.clear()
             try:
-                data = {
-                    "homeworks": self.homeworks,
-                    "settings": self.settings
-                }
-                
-                with open(self.data_file, 'w', encoding='utf-8') as f:
-                    json.dump(data, f, ensure_ascii=False, indent=2)
-                
-                self.root.after(0, self.on_save_data_complete)
-                
+                self._write_data_file()
             except Exception as e:
-                self.root.after(0, lambda: self.on_save_data_error(str(e)))
-        
-        threading.Thread(target=save_task, daemon=True).start()
+                self.root.after(0, lambda msg=str(e): self.on_save_data_error(msg))
     
-    def on_save_data_complete(self):
-        """保存数据完成"""
-        self.task_completed()
+    def _write_data_file(self):
+        """写出待保存的数据：有快照时原子替换数据文件并清空日志，之后的修改追加到日志"""
+        with self._write_lock:
+            with self._save_lock:
+                data = self._pending_snapshot
+                covered = self._snapshot_journal
+                records = self._pending_journal
+                self._pending_snapshot = None
+                self._snapshot_journal = []
+                self._pending_journal = []
+            
+            try:
+                if data is not None:
+                    self._write_snapshot(data, covered)
+                if records:
+                    self._append_journal(records)
+            except Exception:
+                # 写入失败时保留数据，下次保存重试；已有更新的快照时这些修改也已包含在其中
+                with self._save_lock:
+                    if self._pending_snapshot is None:
+                        self._pending_snapshot = data
+                        self._pending_journal[:0] = records
+                        self._snapshot_journal[:0] = covered
+                    else:
+                        self._snapshot_journal[:0] = covered + records
+                raise
+            
+            if records and os.path.getsize(self.journal_file) > _JOURNAL_MAX_BYTES:
+                self.root.after(0, lambda: self.submit_task(TaskType.SAVE_DATA))
+    
+    def _write_snapshot(self, data, covered=()):
+        """将快照原子写入数据文件（先写临时文件再替换），然后删除已包含在快照中的日志"""
+        tmp_file = self.data_file + ".tmp"
+        if self._load_failed:
+            # 启动时读取失败的数据文件及其日志改名保留（.broken），以便手动修复
+            for path in (self.data_file, self.journal_file):
+                if os.path.exists(path):
+                    os.replace(path, path + ".broken")
+            self._load_failed = False
+        try:
+            # 先把快照包含的修改补写进日志，使日志始终是磁盘上的快照之后的完整修改序列
+            if covered:
+                self._append_journal(covered)
+            # 先在内存中完整编码，再一次性写入
+            if orjson is not None:
+                payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+            else:
+                payload = json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8')
+            with open(tmp_file, 'wb') as f:
+                f.write(payload)
+                # 确保内容落盘后再替换，断电时不会得到空文件
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_file, self.data_file)
+        except Exception:
+            if os.path.exists(tmp_file):
+                try:
+                    os.remove(tmp_file)
+                except OSError:
+                    pass
+            raise
+        
+        # 替换后、删除前断电时，日志是从旧快照到新快照的完整修改序列：新增/删除/清空为覆盖式，
+        # 标记只作用于已存在的作业，整段重放到新快照上结果不变（只重放其中一段前缀则不成立）
+        if os.path.exists(self.journal_file):
+            os.remove(self.journal_file)
+    
+    def _append_journal(self, records):
+        """将增量修改逐行追加到日志文件"""
+        if orjson is not None:
+            lines = [orjson.dumps(record) for record in records]
+        else:
+            lines = [json.dumps(record, ensure_ascii=False).encode('utf-8') for record in records]
+        payload = b"\n".join(lines) + b"\n"
+        with open(self.journal_file, 'a+b') as f:
+            # 上次写入中断留下半行时另起一行，避免新记录与之粘连
+            if f.seek(0, os.SEEK_END) > 0:
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b"\n":
+                    payload = b"\n" + payload
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+    
+    def _replay_journal(self, homework_list):
+        """在快照数据上重放日志中的增量修改，返回修改后的作业列表"""
+        if not os.path.exists(self.journal_file):
+            return homework_list
+        
+        loads = orjson.loads if orjson is not None else json.loads
+        by_code = {hw['code']: hw for hw in homework_list}
+        with open(self.journal_file, 'rb') as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    record = loads(line)
+                except ValueError:
+                    # 写入时中断留下的半行，跳过
+                    continue
+                
+                op = record.get("op")
+                if op == "add":
+                    hw = record["homework"]
+                    by_code[hw['code']] = hw
+                elif op == "delete":
+                    for code in record["codes"]:
+                        by_code.pop(code, None)
+                elif op == "mark":
+                    hw = by_code.get(record["code"])
+                    if hw:
+                        hw["status"] = "completed"
+                elif op == "clear":
+                    by_code.clear()
+        
+        return list(by_code.values())
     
     def on_save_data_error(self, error_msg):
         """保存数据错误"""
         messagebox.showerror("保存错误", f"保存数据时出错：{error_msg}")
-        self.task_completed()
+    
+    def on_close(self):
+        """关闭窗口 - 同步写出尚未保存的数据；加载后没有任何修改时不重写数据文件"""
+        try:
+            if self._dirty:
+                # 把日志合并进数据文件
+                self._take_snapshot()
+            self._write_data_file()
+        except Exception as e:
+            messagebox.showerror("保存错误", f"保存数据时出错：{str(e)}")
+        self._refresh_pool.shutdown(wait=False)
+        self.root.destroy()
     
     def execute_add_homework(self, code, subject, content, create_date, due_date):
         """执行添加作业任务"""
@@ -659,11 +1084,10 @@ class HomeworkPlatform:
             self.task_completed()
             return
         
-        for hw in self.homeworks:
-            if hw["code"] == code:
-                messagebox.showerror("错误", f"作业代号 '{code}' 已存在！")
-                self.task_completed()
-                return
+        if code in self._hw_by_code:
+            messagebox.showerror("错误", f"作业代号 '{code}' 已存在！")
+            self.task_completed()
+            return
         
         homework = {
             "code": code,
@@ -674,14 +1098,14 @@ class HomeworkPlatform:
             "status": "pending"
         }
         
-        self.homeworks.append(homework)
+        self._hw_by_code[code] = homework
+        self._index_dates(homework)
         
-        status = self.get_homework_status(due_date)
-        self._status_cache[code] = status
+        self._recompute_status_for(homework, self._today_date, self.settings["remind_days"])
         
         self.root.after(0, lambda: self.clear_input_fields())
         
-        self.submit_task(TaskType.SAVE_DATA)
+        self._journal("add", homework=dict(homework))
         self.submit_task(TaskType.REFRESH_LIST)
         self.submit_task(TaskType.UPDATE_CHARTS)
         
@@ -705,17 +1129,12 @@ class HomeworkPlatform:
         
         normalized_query = self.format_date(query_date_obj)
         
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-        
-        filtered_homeworks = []
-        for hw in self.homeworks:
-            normalized_hw_date = self.normalize_date(hw["due_date"] if query_type == "due" else hw["create_date"])
-            if normalized_hw_date == normalized_query:
-                filtered_homeworks.append(hw)
+        norm_map = self._due_norm if query_type == "due" else self._create_norm
+        filtered_homeworks = [hw for code, hw in self._hw_by_code.items()
+                              if norm_map.get(code) == normalized_query]
         
         sorted_homeworks = self.optimized_sort_homeworks(filtered_homeworks)
-        self.batch_update_treeview_optimized(sorted_homeworks)
+        self.batch_update_treeview_optimized(self._format_rows(sorted_homeworks))
         
         query_type_text = "截止" if query_type == "due" else "创建"
         new_title = f"在 {normalized_query} {query_type_text}的作业 (共{len(filtered_homeworks)}项)"
@@ -724,12 +1143,15 @@ class HomeworkPlatform:
 
     def execute_delete_homework(self, selected_codes):
         """执行删除作业任务"""
-        self.homeworks = [hw for hw in self.homeworks if hw["code"] not in selected_codes]
-        
+        # 按代号删除，只与删除数量有关，与作业总数无关
         for code in selected_codes:
+            self._hw_by_code.pop(code, None)
+            self._due_norm.pop(code, None)
+            self._create_norm.pop(code, None)
             self._status_cache.pop(code, None)
+        self._invalidate_chart_data()
         
-        self.submit_task(TaskType.SAVE_DATA)
+        self._journal("delete", codes=list(selected_codes))
         self.submit_task(TaskType.REFRESH_LIST)
         self.submit_task(TaskType.UPDATE_CHARTS)
         self.show_temp_message(f"{len(selected_codes)} 个作业删除成功！")
@@ -739,9 +1161,9 @@ class HomeworkPlatform:
         """执行清空所有作业任务"""
         self.homeworks = []
         self._status_cache.clear()
-        self.parse_date_cached.cache_clear()
+        self._reset_status_table()
         
-        self.submit_task(TaskType.SAVE_DATA)
+        self._journal("clear")
         self.submit_task(TaskType.REFRESH_LIST)
         self.submit_task(TaskType.UPDATE_CHARTS)
         self.show_temp_message("所有作业已清空！")
@@ -749,13 +1171,12 @@ class HomeworkPlatform:
     
     def execute_mark_completed(self, code):
         """执行标记完成任务"""
-        for hw in self.homeworks:
-            if hw["code"] == code:
-                hw["status"] = "completed"
-                self._status_cache[code] = "completed"
-                break
+        hw = self._hw_by_code.get(code)
+        if hw:
+            hw["status"] = "completed"
+            self._recompute_status_for(hw, self._today_date, self.settings["remind_days"])
+            self._journal("mark", code=code)
         
-        self.submit_task(TaskType.SAVE_DATA)
         self.submit_task(TaskType.REFRESH_LIST)
         self.submit_task(TaskType.UPDATE_CHARTS)
         self.show_temp_message("作业已标记为已完成！")
@@ -763,17 +1184,66 @@ class HomeworkPlatform:
 
     def execute_update_charts(self):
         """执行更新图表任务"""
+        self.update_charts()
+        self.task_completed()
+
+    def update_charts(self):
+        """用汇总数据更新两个图表；图表页不可见时只做标记，切换过去时再重绘"""
+        if self.tabview.get() != "图表":
+            self._charts_dirty = True
+            return
+        self._charts_dirty = False
+        if self._chart_data is None:
+            self._chart_data = self._compute_chart_data(self.homeworks)
         self.update_pie_chart()
         self.update_line_chart()
-        self.task_completed()
+
+    def _debounce(self, key, delay_ms, callback, *args):
+        """同一 key 的回调在 delay_ms 内被多次触发时，只在最后一次之后执行一次"""
+        after_id = self._debounce_ids.get(key)
+        if after_id is not None:
+            self.root.after_cancel(after_id)
+        self._debounce_ids[key] = self.root.after(delay_ms, self._run_debounced, key, callback, args)
+
+    def _run_debounced(self, key, callback, args):
+        """执行到期的防抖回调"""
+        self._debounce_ids.pop(key, None)
+        callback(*args)
+
+    def _debounce_canvas_resize(self, canvas, key):
+        """拖动窗口大小时图表不再随每个 <Configure> 事件重绘，停止拖动 150ms 后重绘一次"""
+        canvas.get_tk_widget().bind(
+            "<Configure>", lambda event: self._debounce(key, 150, canvas.resize, event))
+
+    def _on_tab_change(self):
+        """切换到图表页时补做期间推迟的重绘；第一次打开关于页时才构建其内容"""
+        current = self.tabview.get()
+        if self._charts_dirty and current == "图表":
+            self.update_charts()
+        elif current == "关于" and not self._about_populated:
+            self._about_populated = True
+            self.build_about_tab(self.about_tab)
 
     # ========== 界面构建方法 ==========
     def create_widgets(self):
         """创建界面组件"""
+        # 主界面字体单独创建，修改字号设置时直接 configure，所有使用它的控件随之更新
+        self._font_main = ctk.CTkFont(size=self.settings["main_font_size"])
+        # 其余常用字体的别名，均取自 _font 缓存
+        self._font_title = _font(28, "bold")
+        self._font_section = _font(22, "bold")
+        self._font_label = _font(18)
+        self._font_value = _font(18, "bold")
+        self._font_input = _font(16)
+        self._font_hint = _font(14)
+        
         main_frame = ctk.CTkFrame(self.root)
         main_frame.pack(fill="both", expand=True, padx=20, pady=20)
         
-        self.tabview = ctk.CTkTabview(main_frame)
+        self._charts_dirty = False
+        self._about_populated = False
+        self._debounce_ids = {}
+        self.tabview = ctk.CTkTabview(main_frame, command=self._on_tab_change)
         self.tabview.pack(fill="both", expand=True)
         
         self.main_tab = self.tabview.add("作业管理")
@@ -786,7 +1256,13 @@ class HomeworkPlatform:
         self.build_main_tab(self.main_tab)
         self.build_chart_tab(self.chart_tab)
         self.build_settings_tab(self.settings_tab)
-        self.build_about_tab(self.about_tab)
+        # 关于页（许可协议文本）在第一次切换过去时由 _on_tab_change 构建
+        
+        # 消息标签只创建一次，显示时重新放置，隐藏时 place_forget
+        self.temp_message_label = ctk.CTkLabel(self.root, text="",
+                                              font=self._font_hint,
+                                              corner_radius=5)
+        self._temp_message_after_id = None
 
     def build_main_tab(self, parent):
         """构建主选项卡内容"""
@@ -794,16 +1270,16 @@ class HomeworkPlatform:
         top_frame.pack(fill="x", pady=(0, 10))
         
         title_label = ctk.CTkLabel(top_frame, text=f"作业登记平台 v{self.vers} - 优化版", 
-                                  font=ctk.CTkFont(size=32, weight="bold"))
+                                  font=_font(32, "bold"))
         title_label.pack(pady=(0, 10))
         
         self.queue_status_label = ctk.CTkLabel(top_frame, text="队列: 0 | 当前: 无", 
-                                             font=ctk.CTkFont(size=14),
+                                             font=self._font_hint,
                                              text_color="#6c757d")
         self.queue_status_label.pack()
         
         self.stats_label = ctk.CTkLabel(top_frame, text="正在初始化...", 
-                                       font=ctk.CTkFont(size=18))
+                                       font=self._font_label)
         self.stats_label.pack()
         
         content_frame = ctk.CTkFrame(parent, fg_color="transparent")
@@ -819,39 +1295,39 @@ class HomeworkPlatform:
         row1_frame.pack(fill="x", padx=15, pady=15)
         
         ctk.CTkLabel(row1_frame, text="作业代号:", 
-                    font=ctk.CTkFont(size=self.settings["main_font_size"])).pack(side="left", padx=(0, 5))
-        self.code_entry = ctk.CTkEntry(row1_frame, width=120, font=ctk.CTkFont(size=self.settings["main_font_size"]))
+                    font=self._font_main).pack(side="left", padx=(0, 5))
+        self.code_entry = ctk.CTkEntry(row1_frame, width=120, font=self._font_main)
         self.code_entry.pack(side="left", padx=(0, 20))
         
         ctk.CTkLabel(row1_frame, text="科目:", 
-                    font=ctk.CTkFont(size=self.settings["main_font_size"])).pack(side="left", padx=(0, 5))
-        self.subject_entry = ctk.CTkEntry(row1_frame, width=120, font=ctk.CTkFont(size=self.settings["main_font_size"]))
+                    font=self._font_main).pack(side="left", padx=(0, 5))
+        self.subject_entry = ctk.CTkEntry(row1_frame, width=120, font=self._font_main)
         self.subject_entry.pack(side="left", padx=(0, 20))
         
         row2_frame = ctk.CTkFrame(self.add_frame, fg_color="transparent")
         row2_frame.pack(fill="x", padx=15, pady=(0, 15))
         
         ctk.CTkLabel(row2_frame, text="作业内容:", 
-                    font=ctk.CTkFont(size=self.settings["main_font_size"])).pack(side="left", padx=(0, 5))
-        self.content_entry = ctk.CTkEntry(row2_frame, font=ctk.CTkFont(size=self.settings["main_font_size"]))
+                    font=self._font_main).pack(side="left", padx=(0, 5))
+        self.content_entry = ctk.CTkEntry(row2_frame, font=self._font_main)
         self.content_entry.pack(side="left", fill="x", expand=True, padx=(0, 0))
         
         row3_frame = ctk.CTkFrame(self.add_frame, fg_color="transparent")
         row3_frame.pack(fill="x", padx=15, pady=(0, 15))
         
         ctk.CTkLabel(row3_frame, text="创建日期:", 
-                    font=ctk.CTkFont(size=self.settings["main_font_size"])).pack(side="left", padx=(0, 5))
-        self.create_date_entry = ctk.CTkEntry(row3_frame, width=100, font=ctk.CTkFont(size=self.settings["main_font_size"]))
+                    font=self._font_main).pack(side="left", padx=(0, 5))
+        self.create_date_entry = ctk.CTkEntry(row3_frame, width=100, font=self._font_main)
         self.create_date_entry.pack(side="left", padx=(0, 20))
         self.create_date_entry.insert(0, self.format_date(datetime.now()))
         
         ctk.CTkLabel(row3_frame, text="截止日期:", 
-                    font=ctk.CTkFont(size=self.settings["main_font_size"])).pack(side="left", padx=(0, 5))
-        self.due_date_entry = ctk.CTkEntry(row3_frame, width=100, font=ctk.CTkFont(size=self.settings["main_font_size"]))
+                    font=self._font_main).pack(side="left", padx=(0, 5))
+        self.due_date_entry = ctk.CTkEntry(row3_frame, width=100, font=self._font_main)
         self.due_date_entry.pack(side="left", padx=(0, 20))
         
         ctk.CTkButton(self.add_frame, text="添加作业", command=self.add_homework,
-                      height=35, font=ctk.CTkFont(size=self.settings["main_font_size"])).pack(pady=(0, 15))
+                      height=35, font=self._font_main).pack(pady=(0, 15))
         
         self.query_frame = ctk.CTkFrame(left_frame)
         self.query_frame.pack(fill="x", pady=(0, 15))
@@ -860,33 +1336,33 @@ class HomeworkPlatform:
         query_row1.pack(fill="x", padx=15, pady=15)
         
         ctk.CTkLabel(query_row1, text="查询日期:", 
-                    font=ctk.CTkFont(size=self.settings["main_font_size"])).pack(side="left", padx=(0, 5))
-        self.query_date_entry = ctk.CTkEntry(query_row1, width=100, font=ctk.CTkFont(size=self.settings["main_font_size"]))
+                    font=self._font_main).pack(side="left", padx=(0, 5))
+        self.query_date_entry = ctk.CTkEntry(query_row1, width=100, font=self._font_main)
         self.query_date_entry.pack(side="left", padx=(0, 20))
         self.query_date_entry.insert(0, self.format_date(datetime.now()))
         
         self.query_type = ctk.StringVar(value="due")
         ctk.CTkRadioButton(query_row1, text="按截止日期查询", 
                           variable=self.query_type, value="due",
-                          font=ctk.CTkFont(size=self.settings["main_font_size"])).pack(side="left", padx=(20, 10))
+                          font=self._font_main).pack(side="left", padx=(20, 10))
         ctk.CTkRadioButton(query_row1, text="按创建日期查询", 
                           variable=self.query_type, value="create",
-                          font=ctk.CTkFont(size=self.settings["main_font_size"])).pack(side="left", padx=(10, 0))
+                          font=self._font_main).pack(side="left", padx=(10, 0))
         
         ctk.CTkButton(self.query_frame, text="查询作业", command=self.query_homework,
-                      height=35, font=ctk.CTkFont(size=self.settings["main_font_size"])).pack(pady=(0, 15))
+                      height=35, font=self._font_main).pack(pady=(0, 15))
         
         button_frame = ctk.CTkFrame(left_frame)
         button_frame.pack(fill="x", pady=(0, 0))
         
         ctk.CTkButton(button_frame, text="删除选中作业", command=self.delete_homework,
-                      height=35, font=ctk.CTkFont(size=self.settings["main_font_size"])).pack(fill="x", padx=10, pady=5)
+                      height=35, font=self._font_main).pack(fill="x", padx=10, pady=5)
         ctk.CTkButton(button_frame, text="标记为已完成", command=self.mark_as_completed,
-                      height=35, font=ctk.CTkFont(size=self.settings["main_font_size"])).pack(fill="x", padx=10, pady=5)
+                      height=35, font=self._font_main).pack(fill="x", padx=10, pady=5)
         ctk.CTkButton(button_frame, text="清空所有作业", command=self.clear_all_homework,
-                      height=35, font=ctk.CTkFont(size=self.settings["main_font_size"])).pack(fill="x", padx=10, pady=5)
+                      height=35, font=self._font_main).pack(fill="x", padx=10, pady=5)
         ctk.CTkButton(button_frame, text="刷新列表", command=self.refresh_list,
-                      height=35, font=ctk.CTkFont(size=self.settings["main_font_size"])).pack(fill="x", padx=10, pady=5)
+                      height=35, font=self._font_main).pack(fill="x", padx=10, pady=5)
         
         right_frame = ctk.CTkFrame(content_frame)
         right_frame.pack(side="right", fill="both", expand=True)
@@ -895,7 +1371,7 @@ class HomeworkPlatform:
         self.result_frame.pack(fill="both", expand=True)
         
         self.result_title = ctk.CTkLabel(self.result_frame, text="正在初始化...", 
-                                        font=ctk.CTkFont(size=20, weight="bold"))
+                                        font=_font(20, "bold"))
         self.result_title.pack(pady=10)
         
         tree_frame = ctk.CTkFrame(self.result_frame)
@@ -910,14 +1386,13 @@ class HomeworkPlatform:
                         fieldbackground="#f8f9fa",
                         borderwidth=1,
                         relief="solid",
-                        font=('Microsoft YaHei', self.settings["table_font_size"]),
                         rowheight=45)
         
         style.configure("Custom.Treeview.Heading",
                         background="#e9ecef",
                         foreground="black",
-                        relief="raised",
-                        font=('Microsoft YaHei', self.settings["table_font_size"]+2, 'bold'))
+                        relief="raised")
+        self._apply_table_font(style)
         
         style.map('Custom.Treeview',
                  background=[('selected', '#007bff')],
@@ -937,6 +1412,8 @@ class HomeworkPlatform:
         for col in columns:
             self.tree.heading(col, text=col)
         
+        self._configure_tree_tags()
+        
         scrollbar = ttk.Scrollbar(tree_frame, orient="vertical", command=self.tree.yview)
         self.tree.configure(yscrollcommand=scrollbar.set)
         
@@ -946,202 +1423,131 @@ class HomeworkPlatform:
         self.create_context_menu()
         self.update_stats()
 
+    def _apply_table_font(self, style=None):
+        """按表格字号设置表格和表头字体（修改设置后可直接调用，无需重启）"""
+        style = style or ttk.Style()
+        size = self.settings["table_font_size"]
+        style.configure("Custom.Treeview", font=('Microsoft YaHei', size))
+        style.configure("Custom.Treeview.Heading", font=('Microsoft YaHei', size + 2, 'bold'))
+
+    def _configure_tree_tags(self):
+        """配置状态标签颜色（只在创建表格时调用一次）"""
+        self.tree.tag_configure("completed", background="#e9ecef", foreground="#6c757d")
+        self.tree.tag_configure("overdue", background="#f8d7da", foreground="#721c24")
+        self.tree.tag_configure("due_today", background="#dc3545", foreground="white")
+        self.tree.tag_configure("due_soon", background="#fff3cd", foreground="#856404")
+
     def build_settings_tab(self, parent):
         """构建设置选项卡内容"""
-        title_label = ctk.CTkLabel(parent, text="应用设置", 
-                                  font=ctk.CTkFont(size=28, weight="bold"))
+        title_label = ctk.CTkLabel(parent, text="应用设置", font=self._font_title)
         title_label.pack(pady=(20, 30))
         
         scroll_frame = ctk.CTkScrollableFrame(parent)
         scroll_frame.pack(fill="both", expand=True, padx=20, pady=10)
         
-        font_frame = ctk.CTkFrame(scroll_frame)
-        font_frame.pack(fill="x", pady=(0, 20))
-        
-        font_title = ctk.CTkLabel(font_frame, text="字号设置", 
-                                 font=ctk.CTkFont(size=22, weight="bold"))
-        font_title.pack(pady=(15, 20))
-        
-        main_font_frame = ctk.CTkFrame(font_frame, fg_color="transparent")
-        main_font_frame.pack(fill="x", padx=20, pady=10)
-        
-        ctk.CTkLabel(main_font_frame, text="主界面字号:", 
-                    font=ctk.CTkFont(size=18)).pack(side="left")
-        
-        self.main_font_size_var = ctk.IntVar(value=self.settings["main_font_size"])
-        main_font_slider = ctk.CTkSlider(main_font_frame, from_=12, to=24, number_of_steps=12,
-                                        variable=self.main_font_size_var, command=self.on_main_font_slider_change)
-        main_font_slider.pack(side="left", fill="x", expand=True, padx=20)
-        
-        self.main_font_size_label = ctk.CTkLabel(main_font_frame, text=str(self.settings["main_font_size"]),
-                                               font=ctk.CTkFont(size=18, weight="bold"))
-        self.main_font_size_label.pack(side="left", padx=(0, 10))
-        
-        table_font_frame = ctk.CTkFrame(font_frame, fg_color="transparent")
-        table_font_frame.pack(fill="x", padx=20, pady=10)
-        
-        ctk.CTkLabel(table_font_frame, text="表格字号:", 
-                    font=ctk.CTkFont(size=18)).pack(side="left")
-        
-        self.table_font_size_var = ctk.IntVar(value=self.settings["table_font_size"])
-        table_font_slider = ctk.CTkSlider(table_font_frame, from_=16, to=28, number_of_steps=12,
-                                         variable=self.table_font_size_var, command=self.on_table_font_slider_change)
-        table_font_slider.pack(side="left", fill="x", expand=True, padx=20)
-        
-        self.table_font_size_label = ctk.CTkLabel(table_font_frame, text=str(self.settings["table_font_size"]),
-                                                font=ctk.CTkFont(size=18, weight="bold"))
-        self.table_font_size_label.pack(side="left", padx=(0, 10))
-        
-        theme_frame = ctk.CTkFrame(scroll_frame)
-        theme_frame.pack(fill="x", pady=(0, 20))
-        
-        theme_title = ctk.CTkLabel(theme_frame, text="主题设置", 
-                                  font=ctk.CTkFont(size=22, weight="bold"))
-        theme_title.pack(pady=(15, 20))
-        
-        theme_mode_frame = ctk.CTkFrame(theme_frame, fg_color="transparent")
-        theme_mode_frame.pack(fill="x", padx=20, pady=10)
-        
-        ctk.CTkLabel(theme_mode_frame, text="主题模式:", 
-                    font=ctk.CTkFont(size=18)).pack(side="left")
-        
-        self.theme_mode_var = ctk.StringVar(value=self.settings["theme_mode"])
-        theme_modes = ["Light", "Dark", "System"]
-        theme_option = ctk.CTkOptionMenu(theme_mode_frame, values=theme_modes,
-                                        variable=self.theme_mode_var,
-                                        font=ctk.CTkFont(size=16))
-        theme_option.pack(side="left", padx=20)
-        
-        color_theme_frame = ctk.CTkFrame(theme_frame, fg_color="transparent")
-        color_theme_frame.pack(fill="x", padx=20, pady=10)
-        
-        ctk.CTkLabel(color_theme_frame, text="颜色主题:", 
-                    font=ctk.CTkFont(size=18)).pack(side="left")
-        
-        self.color_theme_var = ctk.StringVar(value=self.settings["color_theme"])
-        color_themes = ["blue", "green", "dark-blue"]
-        color_option = ctk.CTkOptionMenu(color_theme_frame, values=color_themes,
-                                        variable=self.color_theme_var,
-                                        font=ctk.CTkFont(size=16))
-        color_option.pack(side="left", padx=20)
-        
-        window_frame = ctk.CTkFrame(scroll_frame)
-        window_frame.pack(fill="x", pady=(0, 20))
-        
-        window_title = ctk.CTkLabel(window_frame, text="窗口大小设置", 
-                                   font=ctk.CTkFont(size=22, weight="bold"))
-        window_title.pack(pady=(15, 20))
-        
-        window_mode_frame = ctk.CTkFrame(window_frame, fg_color="transparent")
-        window_mode_frame.pack(fill="x", padx=20, pady=10)
-        
-        ctk.CTkLabel(window_mode_frame, text="窗口模式:", 
-                    font=ctk.CTkFont(size=18)).pack(side="left")
-        
-        self.window_mode_var = ctk.StringVar(value=self.settings["window_mode"])
-        window_modes = ["percentage", "pixel"]
-        window_mode_option = ctk.CTkOptionMenu(window_mode_frame, values=window_modes,
-                                              variable=self.window_mode_var,
-                                              font=ctk.CTkFont(size=16),
-                                              command=self.on_window_mode_change)
-        window_mode_option.pack(side="left", padx=20)
-        
-        self.percentage_frame = ctk.CTkFrame(window_frame, fg_color="transparent")
-        self.percentage_frame.pack(fill="x", padx=20, pady=10)
-        
-        ctk.CTkLabel(self.percentage_frame, text="窗口大小百分比:", 
-                    font=ctk.CTkFont(size=18)).pack(side="left")
-        
-        self.window_percentage_var = ctk.IntVar(value=self.settings["window_percentage"])
-        percentage_slider = ctk.CTkSlider(self.percentage_frame, from_=50, to=95, number_of_steps=45,
-                                         variable=self.window_percentage_var, command=self.on_percentage_slider_change)
-        percentage_slider.pack(side="left", fill="x", expand=True, padx=20)
-        
-        self.percentage_label = ctk.CTkLabel(self.percentage_frame, text=f"{self.settings['window_percentage']}%",
-                                           font=ctk.CTkFont(size=18, weight="bold"))
-        self.percentage_label.pack(side="left", padx=(0, 10))
+        font_frame = self._make_settings_group(scroll_frame, "字号设置")
+        # (标签, 设置项, 最小值, 最大值, 步数)；变量保存为 self.<设置项>_var
+        for text, key, from_, to, steps in (
+            ("主界面字号:", "main_font_size", 12, 24, 12),
+            ("表格字号:", "table_font_size", 16, 28, 12),
+        ):
+            _, var = self._make_slider_row(font_frame, text, key, from_, to, steps)
+            setattr(self, f"{key}_var", var)
+        
+        theme_frame = self._make_settings_group(scroll_frame, "主题设置")
+        self.theme_mode_var = self._make_option_row(theme_frame, "主题模式:", "theme_mode",
+                                                    ["Light", "Dark", "System"])
+        self.color_theme_var = self._make_option_row(theme_frame, "颜色主题:", "color_theme",
+                                                     ["blue", "green", "dark-blue"])
+        
+        window_frame = self._make_settings_group(scroll_frame, "窗口大小设置")
+        self.window_mode_var = self._make_option_row(window_frame, "窗口模式:", "window_mode",
+                                                     ["percentage", "pixel"],
+                                                     command=self.on_window_mode_change)
+        self.percentage_frame, self.window_percentage_var = self._make_slider_row(
+            window_frame, "窗口大小百分比:", "window_percentage", 50, 95, 45, value_format="{}%")
         
         self.pixel_frame = ctk.CTkFrame(window_frame, fg_color="transparent")
         if self.settings["window_mode"] != "pixel":
             self.pixel_frame.pack_forget()
         
-        pixel_row1 = ctk.CTkFrame(self.pixel_frame, fg_color="transparent")
-        pixel_row1.pack(fill="x", pady=5)
-        
-        ctk.CTkLabel(pixel_row1, text="窗口宽度:", 
-                    font=ctk.CTkFont(size=16)).pack(side="left", padx=(0, 5))
-        self.width_entry = ctk.CTkEntry(pixel_row1, width=80, font=ctk.CTkFont(size=16))
-        self.width_entry.pack(side="left", padx=(0, 20))
-        self.width_entry.insert(0, str(self.settings["window_width"]))
-        ctk.CTkLabel(pixel_row1, text="px", 
-                    font=ctk.CTkFont(size=16)).pack(side="left")
-        
-        pixel_row2 = ctk.CTkFrame(self.pixel_frame, fg_color="transparent")
-        pixel_row2.pack(fill="x", pady=5)
-        
-        ctk.CTkLabel(pixel_row2, text="窗口高度:", 
-                    font=ctk.CTkFont(size=16)).pack(side="left", padx=(0, 5))
-        self.height_entry = ctk.CTkEntry(pixel_row2, width=80, font=ctk.CTkFont(size=16))
-        self.height_entry.pack(side="left", padx=(0, 20))
-        self.height_entry.insert(0, str(self.settings["window_height"]))
-        ctk.CTkLabel(pixel_row2, text="px", 
-                    font=ctk.CTkFont(size=16)).pack(side="left")
-        
-        function_frame = ctk.CTkFrame(scroll_frame)
-        function_frame.pack(fill="x", pady=(0, 20))
-        
-        function_title = ctk.CTkLabel(function_frame, text="功能设置", 
-                                     font=ctk.CTkFont(size=22, weight="bold"))
-        function_title.pack(pady=(15, 20))
-        
-        remind_frame = ctk.CTkFrame(function_frame, fg_color="transparent")
-        remind_frame.pack(fill="x", padx=20, pady=10)
-        
-        ctk.CTkLabel(remind_frame, text="提前提醒天数:", 
-                    font=ctk.CTkFont(size=18)).pack(side="left")
+        self.width_entry = self._make_pixel_row(self.pixel_frame, "窗口宽度:", "window_width")
+        self.height_entry = self._make_pixel_row(self.pixel_frame, "窗口高度:", "window_height")
         
-        self.remind_days_var = ctk.IntVar(value=self.settings["remind_days"])
-        remind_slider = ctk.CTkSlider(remind_frame, from_=1, to=7, number_of_steps=6,
-                                     variable=self.remind_days_var, command=self.on_remind_days_slider_change)
-        remind_slider.pack(side="left", fill="x", expand=True, padx=20)
-        
-        self.remind_days_label = ctk.CTkLabel(remind_frame, text=str(self.settings["remind_days"]),
-                                             font=ctk.CTkFont(size=18, weight="bold"))
-        self.remind_days_label.pack(side="left", padx=(0, 10))
-        
-        chart_frame = ctk.CTkFrame(function_frame, fg_color="transparent")
-        chart_frame.pack(fill="x", padx=20, pady=10)
-        
-        ctk.CTkLabel(chart_frame, text="图表显示天数:", 
-                    font=ctk.CTkFont(size=18)).pack(side="left")
-        
-        self.chart_days_var = ctk.IntVar(value=self.settings["chart_days"])
-        chart_slider = ctk.CTkSlider(chart_frame, from_=3, to=14, number_of_steps=11,
-                                    variable=self.chart_days_var, command=self.on_chart_days_slider_change)
-        chart_slider.pack(side="left", fill="x", expand=True, padx=20)
-        
-        self.chart_days_label = ctk.CTkLabel(chart_frame, text=str(self.settings["chart_days"]),
-                                           font=ctk.CTkFont(size=18, weight="bold"))
-        self.chart_days_label.pack(side="left", padx=(0, 10))
+        function_frame = self._make_settings_group(scroll_frame, "功能设置")
+        for text, key, from_, to, steps in (
+            ("提前提醒天数:", "remind_days", 1, 7, 6),
+            ("图表显示天数:", "chart_days", 3, 14, 11),
+        ):
+            _, var = self._make_slider_row(function_frame, text, key, from_, to, steps)
+            setattr(self, f"{key}_var", var)
         
         apply_button = ctk.CTkButton(scroll_frame, text="应用所有设置", command=self.apply_all_settings,
-                                    height=40, font=ctk.CTkFont(size=18, weight="bold"))
+                                    height=40, font=self._font_value)
         apply_button.pack(pady=30)
         
         hint_label = ctk.CTkLabel(scroll_frame, 
-                                 text="注意：部分设置需要重启程序才能完全生效",
-                                 font=ctk.CTkFont(size=14),
+                                 text="注意：颜色主题需要重启程序才能完全生效",
+                                 font=self._font_hint,
                                  text_color="#ff6b6b")
         hint_label.pack(pady=(0, 15))
 
+    def _make_settings_group(self, parent, title):
+        """创建带标题的设置分组"""
+        group = ctk.CTkFrame(parent)
+        group.pack(fill="x", pady=(0, 20))
+        ctk.CTkLabel(group, text=title, font=self._font_section).pack(pady=(15, 20))
+        return group
+
+    def _make_slider_row(self, parent, text, setting_key, from_, to, steps, value_format="{}"):
+        """创建“标签 + 滑块 + 当前值”一行，返回 (行框架, 变量)"""
+        row = ctk.CTkFrame(parent, fg_color="transparent")
+        row.pack(fill="x", padx=20, pady=10)
+        
+        ctk.CTkLabel(row, text=text, font=self._font_label).pack(side="left")
+        
+        var = ctk.IntVar(value=self.settings[setting_key])
+        value_label = ctk.CTkLabel(row, text=value_format.format(self.settings[setting_key]),
+                                   font=self._font_value)
+        slider = ctk.CTkSlider(row, from_=from_, to=to, number_of_steps=steps, variable=var,
+                               command=lambda value: value_label.configure(text=value_format.format(int(value))))
+        slider.pack(side="left", fill="x", expand=True, padx=20)
+        value_label.pack(side="left", padx=(0, 10))
+        return row, var
+
+    def _make_option_row(self, parent, text, setting_key, values, command=None):
+        """创建“标签 + 下拉菜单”一行，返回变量"""
+        row = ctk.CTkFrame(parent, fg_color="transparent")
+        row.pack(fill="x", padx=20, pady=10)
+        
+        ctk.CTkLabel(row, text=text, font=self._font_label).pack(side="left")
+        
+        var = ctk.StringVar(value=self.settings[setting_key])
+        option = ctk.CTkOptionMenu(row, values=values, variable=var,
+                                   font=self._font_input, command=command)
+        option.pack(side="left", padx=20)
+        return var
+
+    def _make_pixel_row(self, parent, text, setting_key):
+        """创建像素尺寸输入行，返回输入框"""
+        row = ctk.CTkFrame(parent, fg_color="transparent")
+        row.pack(fill="x", pady=5)
+        
+        ctk.CTkLabel(row, text=text, font=self._font_input).pack(side="left", padx=(0, 5))
+        entry = ctk.CTkEntry(row, width=80, font=self._font_input)
+        entry.pack(side="left", padx=(0, 20))
+        entry.insert(0, str(self.settings[setting_key]))
+        ctk.CTkLabel(row, text="px", font=self._font_input).pack(side="left")
+        return entry
+
     def build_chart_tab(self, parent):
         """构建图表选项卡内容"""
         title_label = ctk.CTkLabel(parent, text="作业统计图表", 
-                                  font=ctk.CTkFont(size=28, weight="bold"))
+                                  font=self._font_title)
         title_label.pack(pady=(20, 10))
         
         refresh_button = ctk.CTkButton(parent, text="刷新图表", command=lambda: self.submit_task(TaskType.UPDATE_CHARTS),
-                                      height=35, font=ctk.CTkFont(size=16))
+                                      height=35, font=self._font_input)
         refresh_button.pack(pady=(0, 10))
         
         scroll_frame = ctk.CTkScrollableFrame(parent)
@@ -1151,46 +1557,54 @@ class HomeworkPlatform:
         pie_frame.pack(fill="x", pady=(0, 20))
         
         pie_title = ctk.CTkLabel(pie_frame, text="作业状态分布", 
-                                font=ctk.CTkFont(size=20, weight="bold"))
+                                font=_font(20, "bold"))
         pie_title.pack(pady=10)
         
         self.pie_fig = Figure(figsize=(8, 6), dpi=100)
+        self.pie_ax = self.pie_fig.add_subplot(111)
         self.pie_canvas = FigureCanvasTkAgg(self.pie_fig, pie_frame)
+        self._pie_labels = None
+        self._pie_sizes = None
         self.pie_canvas.get_tk_widget().pack(fill="both", expand=True, padx=10, pady=10)
+        self._debounce_canvas_resize(self.pie_canvas, "pie_resize")
         
         line_frame = ctk.CTkFrame(scroll_frame)
         line_frame.pack(fill="x", pady=(0, 20))
         
-        line_title = ctk.CTkLabel(line_frame, text=f"最近{self.settings['chart_days']}天作业量统计", 
-                                 font=ctk.CTkFont(size=20, weight="bold"))
-        line_title.pack(pady=10)
+        self.line_title = ctk.CTkLabel(line_frame, text=f"最近{self.settings['chart_days']}天作业量统计", 
+                                       font=_font(20, "bold"))
+        self.line_title.pack(pady=10)
         
         self.line_fig = Figure(figsize=(10, 6), dpi=100)
+        self.line_ax = self.line_fig.add_subplot(111)
         self.line_canvas = FigureCanvasTkAgg(self.line_fig, line_frame)
+        self._line_days = None
+        self._line_create_texts = []
+        self._line_due_texts = []
         self.line_canvas.get_tk_widget().pack(fill="both", expand=True, padx=10, pady=10)
+        self._debounce_canvas_resize(self.line_canvas, "line_resize")
         
-        self.update_pie_chart()
-        self.update_line_chart()
+        self.update_charts()
 
     def build_about_tab(self, parent):
         """构建关于选项卡内容"""
         title_label = ctk.CTkLabel(parent, text=f"作业登记平台 v{self.vers} - 优化版", 
-                                  font=ctk.CTkFont(size=28, weight="bold"))
+                                  font=self._font_title)
         title_label.pack(pady=(20, 10))
         
         version_label = ctk.CTkLabel(parent, text=f"版本 {self.vers} - 高性能优化版", 
-                                    font=ctk.CTkFont(size=18))
+                                    font=self._font_label)
         version_label.pack(pady=(0, 30))
         
         CC_title = ctk.CTkLabel(parent, text="CC-BY-NC-SA 4.0 许可协议", 
-                                font=ctk.CTkFont(size=22, weight="bold"))
+                                font=self._font_section)
         CC_title.pack(pady=(0, 15))
         
         text_frame = ctk.CTkFrame(parent)
         text_frame.pack(fill="both", expand=True, padx=20, pady=10)
         
         text_widget = ctk.CTkTextbox(text_frame, 
-                                   font=ctk.CTkFont(size=14, family="Consolas"),
+                                   font=_font(14, family="Consolas"),
                                    wrap="word")
         text_widget.pack(fill="both", expand=True, padx=10, pady=10)
         
@@ -1226,30 +1640,18 @@ https://creativecommons.org/licenses/by-nc-sa/4.0/legalcode.zh-hans"""
             self.percentage_frame.pack_forget()
             self.pixel_frame.pack(fill="x", padx=20, pady=10)
 
-    def on_percentage_slider_change(self, value):
-        self.percentage_label.configure(text=f"{int(value)}%")
-
-    def on_main_font_slider_change(self, value):
-        self.main_font_size_label.configure(text=str(int(value)))
-
-    def on_table_font_slider_change(self, value):
-        self.table_font_size_label.configure(text=str(int(value)))
-
-    def on_remind_days_slider_change(self, value):
-        self.remind_days_label.configure(text=str(int(value)))
-
-    def on_chart_days_slider_change(self, value):
-        self.chart_days_label.configure(text=str(int(value)))
-
     def apply_all_settings(self):
         """应用所有设置"""
         try:
+            old_settings = dict(self.settings)
             self.settings["main_font_size"] = self.main_font_size_var.get()
             self.settings["table_font_size"] = self.table_font_size_var.get()
             self.settings["theme_mode"] = self.theme_mode_var.get()
             self.settings["color_theme"] = self.color_theme_var.get()
             self.settings["window_mode"] = self.window_mode_var.get()
             self.settings["window_percentage"] = self.window_percentage_var.get()
+            remind_changed = self.settings["remind_days"] != self.remind_days_var.get()
+            chart_changed = self.settings["chart_days"] != self.chart_days_var.get()
             self.settings["remind_days"] = self.remind_days_var.get()
             self.settings["chart_days"] = self.chart_days_var.get()
             
@@ -1263,17 +1665,39 @@ https://creativecommons.org/licenses/by-nc-sa/4.0/legalcode.zh-hans"""
             
             self.submit_task(TaskType.SAVE_DATA)
             
+            # 提醒天数变化后批量重算状态，无需重启即可生效
+            if remind_changed:
+                self.precompute_homework_statuses()
+                self.submit_task(TaskType.REFRESH_STATUSES)
+            if chart_changed:
+                self.line_title.configure(text=f"最近{self.settings['chart_days']}天作业量统计")
+            if remind_changed or chart_changed:
+                self.submit_task(TaskType.UPDATE_CHARTS)
+            
             ctk.set_appearance_mode(self.settings["theme_mode"])
             ctk.set_default_color_theme(self.settings["color_theme"])
             self.apply_window_size()
             
+            # 字号即时生效
+            if self.settings["main_font_size"] != old_settings["main_font_size"]:
+                self._font_main.configure(size=self.settings["main_font_size"])
+            if self.settings["table_font_size"] != old_settings["table_font_size"]:
+                self._apply_table_font()
+            
+            changed = {key for key, value in self.settings.items() if old_settings.get(key) != value}
+            if not changed & _RESTART_KEYS:
+                self.show_temp_message("设置已保存并生效！")
+                return
+            
             result = messagebox.askyesno(
                 "设置已保存", 
-                "设置已保存！\n\n部分设置需要重启程序才能完全生效。\n\n是否现在重启软件？",
+                "设置已保存！\n\n颜色主题需要重启程序才能完全生效。\n\n是否现在重启软件？",
                 detail="点击'是'立即重启软件，点击'否'继续使用当前会话"
             )
             
             if result:
+                self._take_snapshot()
+                self._write_data_file()
                 self.root.destroy()
                 os.execv(sys.executable, ['python'] + sys.argv)
             
@@ -1281,64 +1705,64 @@ https://creativecommons.org/licenses/by-nc-sa/4.0/legalcode.zh-hans"""
             messagebox.showerror("错误", f"保存设置时出错：{str(e)}")
 
     # ========== 图表更新方法 ==========
+    def _compute_chart_data(self, homeworks):
+        """汇总统计栏和两个图表的数据：状态计数，以及全部作业的创建/截止日期序数数组"""
+        date_ordinal = self._due_ordinal
+        count = len(homeworks)
+        
+        # 日期序数数组，折线图按天数窗口用 np.bincount 分桶；无法解析的日期为 -1
+        create_days = np.fromiter((date_ordinal(hw['create_date']) for hw in homeworks),
+                                  dtype=np.int64, count=count)
+        due_days = np.fromiter((date_ordinal(hw['due_date']) for hw in homeworks),
+                               dtype=np.int64, count=count)
+        
+        return {"pie": self._compute_status_summary(homeworks), "create": create_days, "due": due_days}
+
+    def _compute_status_summary(self, homeworks):
+        """统计显示中的作业各状态数量（已完成的作业计为 completed）"""
+        # 状态表的排序权重即状态编码（已完成的作业为 _COMPLETED），按位置取出后一次 bincount
+        code_pos, weight_arr, _, display_arr = self._status_table
+        positions = np.fromiter((code_pos[hw['code']] for hw in homeworks),
+                                dtype=np.intp, count=len(homeworks))
+        positions = positions[display_arr[positions]]
+        counts = np.bincount(weight_arr[positions], minlength=len(_STATUS_NAMES))
+        return Counter({name: count for name, count in zip(_STATUS_NAMES, counts.tolist()) if count})
+
+    @staticmethod
+    def _count_per_day(day_ordinals, first_day, days):
+        """统计从 first_day 起连续 days 天内每天的作业数"""
+        offsets = day_ordinals - first_day
+        return np.bincount(offsets[(offsets >= 0) & (offsets < days)], minlength=days)
+
     def update_pie_chart(self):
-        """更新饼图"""
-        self.pie_fig.clear()
-        
-        status_counts = {
-            'completed': 0,
-            'overdue': 0,
-            'due_today': 0,
-            'due_soon': 0,
-            'pending': 0
-        }
+        """更新饼图 - 类别不变时原地调整扇形和文字，类别变化时才重新绘制"""
+        status_counts = self._chart_data["pie"]
         
-        for hw in self.homeworks:
-            if not self.should_display_homework(hw):
-                continue
-                
-            if hw.get('status') == 'completed':
-                status_counts['completed'] += 1
-            else:
-                status = self.get_homework_status_optimized(hw['code'])
-                status_counts[status] += 1
-        
-        labels = []
-        sizes = []
-        colors = []
-        
-        if status_counts['completed'] > 0:
-            labels.append('已完成')
-            sizes.append(status_counts['completed'])
-            colors.append('#28a745')
-        
-        if status_counts['overdue'] > 0:
-            labels.append('逾期')
-            sizes.append(status_counts['overdue'])
-            colors.append('#dc3545')
-        
-        if status_counts['due_today'] > 0:
-            labels.append('今天截止')
-            sizes.append(status_counts['due_today'])
-            colors.append('#fd7e14')
-        
-        if status_counts['due_soon'] > 0:
-            labels.append('即将截止')
-            sizes.append(status_counts['due_soon'])
-            colors.append('#ffc107')
-        
-        if status_counts['pending'] > 0:
-            labels.append('进行中')
-            sizes.append(status_counts['pending'])
-            colors.append('#007bff')
-        
-        if not sizes:
-            ax = self.pie_fig.add_subplot(111)
+        active = [(label, color, status_counts[key])
+                  for key, label, color in _PIE_CATEGORIES if status_counts[key] > 0]
+        
+        labels = tuple(label for label, _, _ in active) or None
+        sizes = tuple(size for _, _, size in active)
+        if labels == self._pie_labels and sizes == self._pie_sizes:
+            # 数据与上次绘制时相同，无需重绘
+            return
+        self._pie_sizes = sizes
+        if labels is not None and labels == self._pie_labels:
+            self._update_pie_wedges(sizes)
+            self.pie_canvas.draw_idle()
+            return
+        self._pie_labels = labels
+        
+        ax = self.pie_ax
+        ax.clear()
+        
+        if not active:
+            ax.set_aspect('auto')
             ax.text(0.5, 0.5, '暂无数据', ha='center', va='center', fontsize=16)
             ax.set_xlim(0, 1)
             ax.set_ylim(0, 1)
         else:
-            ax = self.pie_fig.add_subplot(111)
+            labels, colors, sizes = zip(*active)
             wedges, texts, autotexts = ax.pie(sizes, labels=labels, colors=colors, autopct='%1.1f%%',
                                             startangle=90, textprops={'fontsize': 12})
             
@@ -1346,68 +1770,120 @@ https://creativecommons.org/licenses/by-nc-sa/4.0/legalcode.zh-hans"""
                 autotext.set_color('white')
                 autotext.set_fontweight('bold')
             
+            self._pie_artists = (wedges, texts, autotexts)
+            
             ax.set_title('作业状态分布', fontsize=16, fontweight='bold')
             ax.axis('equal')
         
-        self.pie_canvas.draw()
+        self.pie_canvas.draw_idle()
+
+    def _update_pie_wedges(self, sizes):
+        """按新数量调整扇形角度、标签位置和百分比文字（与 ax.pie 的布局一致）"""
+        total = float(sum(sizes))
+        theta1 = 90.0
+        for wedge, text, autotext, size in zip(*self._pie_artists, sizes):
+            theta2 = theta1 + 360.0 * size / total
+            wedge.set_theta1(theta1)
+            wedge.set_theta2(theta2)
+            
+            theta_mid = np.deg2rad((theta1 + theta2) / 2)
+            x, y = np.cos(theta_mid), np.sin(theta_mid)
+            text.set_position((1.1 * x, 1.1 * y))
+            text.set_horizontalalignment('left' if x > 0 else 'right')
+            autotext.set_position((0.6 * x, 0.6 * y))
+            autotext.set_text('%1.1f%%' % (100.0 * size / total))
+            theta1 = theta2
 
     def update_line_chart(self):
-        """更新折线图"""
-        self.line_fig.clear()
-        
+        """更新折线图 - 复用坐标轴和线条，只更新数据"""
         days = self.settings["chart_days"]
-        today = datetime.now()
-        dates = []
-        for i in range(days-1, -1, -1):
-            date_obj = today - timedelta(days=i)
-            dates.append(self.format_date(date_obj))
-        
-        create_counts = [0] * days
-        due_counts = [0] * days
-        
-        for hw in self.homeworks:
-            normalized_create = self.normalize_date(hw['create_date'])
-            normalized_due = self.normalize_date(hw['due_date'])
-            
-            for i, date in enumerate(dates):
-                if normalized_create == date:
-                    create_counts[i] += 1
-            
-            for i, date in enumerate(dates):
-                if normalized_due == date:
-                    due_counts[i] += 1
         
-        ax = self.line_fig.add_subplot(111)
-        line1, = ax.plot(range(days), create_counts, marker='o', linewidth=2, label='创建作业', color='#007bff')
-        line2, = ax.plot(range(days), due_counts, marker='s', linewidth=2, label='截止作业', color='#dc3545')
+        # 日期序数减去窗口起点即为下标，一次 bincount 完成分桶；与状态计算使用同一天
+        first_day = self._today_date.toordinal() - days + 1
+        chart_data = self._chart_data
+        create_counts = self._count_per_day(chart_data["create"], first_day, days)
+        due_counts = self._count_per_day(chart_data["due"], first_day, days)
+        
+        # 天数变化时才重建坐标轴
+        if self._line_days != days:
+            self._build_line_chart(days)
+        
+        ax = self.line_ax
+        x = range(days)
+        self._line_create_artist.set_data(x, create_counts)
+        self._line_due_artist.set_data(x, due_counts)
+        # 日期标签只在窗口起点变化（跨天或天数改变）时重新生成
+        if self._line_first_day != first_day:
+            dates = [self.format_date(datetime.fromordinal(day))
+                     for day in range(first_day, first_day + days)]
+            ax.set_xticklabels(dates, rotation=45)
+            self._line_first_day = first_day
+        
+        # 只改动数量与上次不同的标注（新建的标注为空、对应数量 0）
+        changed = np.flatnonzero((create_counts != self._line_create_counts) |
+                                 (due_counts != self._line_due_counts))
+        for i, create, due in zip(changed.tolist(), create_counts[changed].tolist(),
+                                  due_counts[changed].tolist()):
+            create_text = self._line_create_texts[i]
+            create_text.set_text(str(create) if create > 0 else '')
+            create_text.xy = (i, create)
+            due_text = self._line_due_texts[i]
+            due_text.set_text(str(due) if due > 0 else '')
+            due_text.xy = (i, due)
+        self._line_create_counts = create_counts
+        self._line_due_counts = due_counts
+        
+        ax.relim()
+        ax.autoscale_view()
+        ax.set_ylim(bottom=0, auto=None)
+        self.line_canvas.draw_idle()
+
+    def _build_line_chart(self, days):
+        """按天数设置折线图坐标轴和数值标注；线条、图例和网格只在第一次创建"""
+        ax = self.line_ax
+        if self._line_days is None:
+            self._line_create_artist, = ax.plot([], [], marker='o', linewidth=2, label='创建作业', color='#007bff')
+            self._line_due_artist, = ax.plot([], [], marker='s', linewidth=2, label='截止作业', color='#dc3545')
+            ax.set_xlabel('日期', fontsize=12)
+            ax.set_ylabel('作业数量', fontsize=12)
+            ax.legend(fontsize=12)
+            ax.grid(True, alpha=0.3)
+        
+        # 天数变化时只移除旧的标注，坐标轴保留
+        for text in self._line_create_texts + self._line_due_texts:
+            text.remove()
         
         ax.set_title(f'最近{days}天作业量统计', fontsize=16, fontweight='bold')
-        ax.set_xlabel('日期', fontsize=12)
-        ax.set_ylabel('作业数量', fontsize=12)
-        ax.legend(fontsize=12)
-        ax.grid(True, alpha=0.3)
-        
+        ax.set_xlim(-0.5, days - 0.5)
         ax.set_xticks(range(days))
-        ax.set_xticklabels(dates, rotation=45)
         
-        for i, (create, due) in enumerate(zip(create_counts, due_counts)):
-            if create > 0:
-                ax.annotate(str(create), (i, create), textcoords="offset points", 
-                           xytext=(0,10), ha='center', fontsize=10, fontweight='bold')
-            if due > 0:
-                ax.annotate(str(due), (i, due), textcoords="offset points", 
-                           xytext=(0,-15), ha='center', fontsize=10, fontweight='bold')
+        # 预先创建标注，更新时只修改文本和位置
+        self._line_create_texts = [
+            ax.annotate('', (i, 0), textcoords="offset points",
+                        xytext=(0,10), ha='center', fontsize=10, fontweight='bold')
+            for i in range(days)
+        ]
+        self._line_due_texts = [
+            ax.annotate('', (i, 0), textcoords="offset points",
+                        xytext=(0,-15), ha='center', fontsize=10, fontweight='bold')
+            for i in range(days)
+        ]
+        self._line_create_counts = np.zeros(days, dtype=np.int64)
+        self._line_due_counts = np.zeros(days, dtype=np.int64)
         
-        ax.set_ylim(bottom=0)
+        self._line_days = days
+        self._line_first_day = None
+        # 日期标签宽度固定，布局只需计算一次
+        ax.set_xticklabels([self.format_date(self._today_date)] * days, rotation=45)
         self.line_fig.tight_layout()
-        self.line_canvas.draw()
 
     # ========== 辅助方法 ==========
     def create_context_menu(self):
-        """创建右键菜单"""
-        self.context_menu = tk.Menu(self.root, tearoff=0, font=('Microsoft YaHei', 20))
-        self.context_menu.add_command(label="删除作业", command=self.delete_homework)
-        self.context_menu.add_command(label="标记为已完成", command=self.mark_as_completed)
+        """创建右键菜单（菜单只创建一次，再次调用时只重新绑定到当前表格）"""
+        if not hasattr(self, 'context_menu'):
+            self.context_menu = tk.Menu(self.root, tearoff=0, font=_CONTEXT_MENU_FONT)
+            self.context_menu.add_command(label="删除作业", command=self.delete_homework)
+            self.context_menu.add_command(label="标记为已完成", command=self.mark_as_completed)
         self.tree.bind("<Button-3>", self.show_context_menu)
 
     def show_context_menu(self, event):
@@ -1419,15 +1895,24 @@ https://creativecommons.org/licenses/by-nc-sa/4.0/legalcode.zh-hans"""
 
     def show_temp_message(self, message, duration=2000):
         """显示临时消息"""
-        if hasattr(self, 'temp_message_label'):
-            self.temp_message_label.destroy()
+        self._show_message_label(message, fg_color="#d4edda", text_color="#155724")
+        self._temp_message_after_id = self.root.after(duration, self.hide_temp_message)
+
+    def _show_message_label(self, message, fg_color, text_color):
+        """复用同一个消息标签显示文本"""
+        if self._temp_message_after_id is not None:
+            self.root.after_cancel(self._temp_message_after_id)
+            self._temp_message_after_id = None
         
-        self.temp_message_label = ctk.CTkLabel(self.root, text=message, 
-                                              font=ctk.CTkFont(size=14),
-                                              fg_color="#d4edda", text_color="#155724",
-                                              corner_radius=5)
+        self.temp_message_label.configure(text=message, fg_color=fg_color, text_color=text_color)
         self.temp_message_label.place(relx=0.5, rely=0.1, anchor="center")
-        self.root.after(duration, self.temp_message_label.destroy)
+
+    def hide_temp_message(self):
+        """隐藏消息标签"""
+        if self._temp_message_after_id is not None:
+            self.root.after_cancel(self._temp_message_after_id)
+            self._temp_message_after_id = None
+        self.temp_message_label.place_forget()
 
     def apply_window_size(self):
         """应用窗口大小设置"""
@@ -1445,48 +1930,20 @@ https://creativecommons.org/licenses/by-nc-sa/4.0/legalcode.zh-hans"""
         
         self.root.geometry(f"{width}x{height}")
 
-    def insert_homework_item(self, hw):
-        """插入单个作业项到树形视图"""
-        status = self._status_cache.get(hw['code'], "pending")
-        
-        if hw.get('status') == 'completed':
-            display_status = "✅ 已完成"
-            tags = ("completed",)
-        else:
-            if status == "due_today":
-                display_status = "🔥 今天截止"
-                tags = ("due_today",)
-            elif status == "overdue":
-                display_status = "⚠️ 逾期"
-                tags = ("overdue",)
-            elif status == "due_soon":
-                display_status = "⏰ 即将截止"
-                tags = ("due_soon",)
-            else:
-                display_status = "📝 进行中"
-                tags = ("",)
-        
-        item = self.tree.insert("", "end", values=(
-            hw["code"], hw["subject"], hw["content"], 
-            hw["create_date"], hw["due_date"], display_status
-        ), tags=tags)
-        
-        self.tree.tag_configure("completed", background="#e9ecef", foreground="#6c757d")
-        self.tree.tag_configure("overdue", background="#f8d7da", foreground="#721c24")
-        self.tree.tag_configure("due_today", background="#dc3545", foreground="white")
-        self.tree.tag_configure("due_soon", background="#fff3cd", foreground="#856404")
-
     def update_stats(self):
         """更新统计信息"""
         if not self.data_loaded:
             self.stats_label.configure(text="数据加载中...")
             return
             
-        display_homeworks = [hw for hw in self.homeworks if self.should_display_homework(hw)]
-        total = len(display_homeworks)
-        completed = len([hw for hw in display_homeworks if hw.get('status') == 'completed'])
-        overdue = len([hw for hw in display_homeworks if self._status_cache.get(hw['code']) == 'overdue' and hw.get('status') != 'completed'])
-        due_today = len([hw for hw in display_homeworks if self._status_cache.get(hw['code']) == 'due_today' and hw.get('status') != 'completed'])
+        # 与饼图共用同一份状态计数，刷新列表时已在工作线程中算好
+        if self._chart_data is None:
+            self._chart_data = self._compute_chart_data(self.homeworks)
+        status_counts = self._chart_data["pie"]
+        total = sum(status_counts.values())
+        completed = status_counts['completed']
+        overdue = status_counts['overdue']
+        due_today = status_counts['due_today']
         
         stats_text = f"总计: {total} | 已完成: {completed} | 逾期: {overdue} | 今天截止: {due_today}"
         self.stats_label.configure(text=stats_text)
@@ -1502,27 +1959,20 @@ https://creativecommons.org/licenses/by-nc-sa/4.0/legalcode.zh-hans"""
         date_obj = self.parse_date_cached(date_str)
         return self.format_date(date_obj) if date_obj else date_str
 
-    def get_homework_status(self, due_date):
-        """原始状态获取方法"""
+    def get_homework_status(self, due_date, today_date_only=None):
+        """原始状态获取方法（未传入 today_date_only 时使用最近一次批量刷新的日期）"""
         due = self.parse_date_cached(due_date)
         if not due: return "pending"
             
-        today = datetime.now()
-        due_date_only, today_date_only = due.date(), today.date()
+        if today_date_only is None:
+            today_date_only = self._today_date
+        due_date_only = due.date()
         
         if due_date_only < today_date_only: return "overdue"
         elif due_date_only == today_date_only: return "due_today"
         elif (due_date_only - today_date_only).days <= self.settings["remind_days"]: return "due_soon"
         else: return "pending"
 
-    def should_display_homework(self, hw):
-        if hw.get('status') == 'completed':
-            try:
-                due_date = self.parse_date_cached(hw['due_date'])
-                return due_date.date() >= datetime.now().date()
-            except: return True
-        return True
-
     # ========== 用户交互方法 ==========
     def add_homework(self):
         """添加新作业"""
@@ -0,0 +1,83 @@
+"""启动测试：在临时目录中构造 HomeworkPlatform，确认程序能正常启动"""
+import importlib.machinery
+import importlib.util
+import json
+import os
+import tempfile
+import tkinter as tk
+import unittest
+
+APP_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                        "HomeworkRecord V2.9.pyw")
+
+
+def load_app_module():
+    """按路径加载主程序（文件名含空格且扩展名为 .pyw，不能直接 import）"""
+    loader = importlib.machinery.SourceFileLoader("homework_record", APP_PATH)
+    spec = importlib.util.spec_from_loader("homework_record", loader)
+    module = importlib.util.module_from_spec(spec)
+    loader.exec_module(module)
+    return module
+
+
+class StartupTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app_module = load_app_module()
+
+    def setUp(self):
+        self._old_cwd = os.getcwd()
+        self._tmp = tempfile.TemporaryDirectory()
+        os.chdir(self._tmp.name)
+        try:
+            self.root = self.app_module.ctk.CTk()
+        except tk.TclError as e:
+            os.chdir(self._old_cwd)
+            self._tmp.cleanup()
+            self.skipTest(f"没有可用的显示器：{e}")
+
+    def tearDown(self):
+        try:
+            self.root.destroy()
+        except tk.TclError:
+            # on_close 已经销毁了窗口
+            pass
+        os.chdir(self._old_cwd)
+        self._tmp.cleanup()
+
+    def _construct(self):
+        app = self.app_module.HomeworkPlatform(self.root)
+        self.root.update()
+        app._refresh_pool.shutdown(wait=True)
+        return app
+
+    def test_construct_without_data_file(self):
+        app = self._construct()
+        self.assertTrue(app.data_loaded)
+        self.assertEqual(list(app.homeworks), [])
+
+    def test_construct_with_data_file(self):
+        data = {
+            "homeworks": [{"code": "A1", "subject": "数学", "content": "练习",
+                           "create_date": "01/01/2025", "due_date": "02/01/2025",
+                           "status": "pending"}],
+            "settings": {"chart_days": 7},
+        }
+        with open("homework_data.json", "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+        app = self._construct()
+        self.assertEqual([hw["code"] for hw in app.homeworks], ["A1"])
+        self.assertEqual(app.settings["chart_days"], 7)
+
+    def test_close_after_failed_load_keeps_data_file(self):
+        broken = '{"homeworks": [], , "settings": {}}'
+        with open("homework_data.json", "w", encoding="utf-8") as f:
+            f.write(broken)
+        app = self._construct()
+        app.on_close()
+        with open("homework_data.json", encoding="utf-8") as f:
+            self.assertEqual(f.read(), broken)
+
+
+if __name__ == "__main__":
+    unittest.main()